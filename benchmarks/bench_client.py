@@ -0,0 +1,177 @@
+"""Offline throughput and latency benchmark of :class:`tokage.Client`.
+
+Runs the Client against `stub_server.py` (started in a subprocess, so its CPU time is
+not counted) and reports, per workload: requests/sec, p50/p99 latency, client CPU
+time per request and peak memory traced while running it. With `--pool-limit`, the
+Client's connection pool is sized explicitly and the average wait for a free
+connection is reported as well. With `--metrics`, the time spent per request phase
+(network, body read, decoding, model building) is reported per workload. With
+`--cache-ttl`, every Client gets its own :class:`tokage.MemoryCache`; the `get_anime_hot`
+workload cycles through a few IDs, so its entries keep expiring, and `--stale` sets
+the cache's stale-while-revalidate and stale-if-error windows.
+
+Usage::
+
+    python benchmarks/bench_client.py [--requests 500] [--concurrency 20]
+                                      [--latency 0.02] [--jitter 0.01] [--error-rate 0.0] [--retry]
+                                      [--pool-limit N] [--metrics] [--cache-ttl S] [--stale S]
+                                      [--workloads get_anime search_anime ...]
+"""
+
+import argparse
+import asyncio
+import functools
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tokage  # noqa: E402
+
+STUB_SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stub_server.py')
+BATCH_SIZE = 50
+HOT_IDS = 20
+
+
+def _batch(getter):
+    async def call(client, i, concurrency):
+        ids = range(i * BATCH_SIZE + 1, (i + 1) * BATCH_SIZE + 1)
+        results = await getattr(client, getter)(ids, concurrency=concurrency)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
+    return call
+
+
+# every call but those of `get_anime_hot` uses a distinct ID or query, so requests are never coalesced or cached
+WORKLOADS = {
+    'get_anime': lambda client, i, _: client.get_anime(i + 1),
+    'get_manga': lambda client, i, _: client.get_manga(i + 1),
+    'get_person': lambda client, i, _: client.get_person(i + 1),
+    'get_character': lambda client, i, _: client.get_character(i + 1),
+    'search_anime': lambda client, i, _: client.search_anime('bebop{}'.format(i)),
+    'search_person': lambda client, i, _: client.search_person('yamadera{}'.format(i)),
+    'get_anime_many': _batch('get_anime_many'),
+    'get_anime_hot': lambda client, i, _: client.get_anime(i % HOT_IDS + 1),
+}
+# workloads whose calls each make BATCH_SIZE requests
+BATCHED = {'get_anime_many'}
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[int(round(fraction * (len(values) - 1)))]
+
+
+async def run_workload(base_url, name, calls, concurrency, client_kwargs):
+    call = WORKLOADS[name]
+    client_kwargs = dict(client_kwargs)
+    if 'cache' in client_kwargs:
+        client_kwargs['cache'] = client_kwargs['cache']()
+    client = tokage.Client(base_url=base_url, **client_kwargs)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def timed(i):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call(client, i, concurrency)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(calls)))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    pool = client.pool_stats()
+    await client.cleanup()
+    return latencies, errors, wall, cpu, pool
+
+
+async def measure_memory(base_url, name, calls, concurrency, client_kwargs):
+    tracemalloc.start()
+    try:
+        await run_workload(base_url, name, calls, concurrency, client_kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+async def bench(base_url, args, client_kwargs=None):
+    client_kwargs = client_kwargs or {}
+    metrics = client_kwargs.get('hooks')
+    summaries = []
+    print('{:<16} {:>8} {:>7} {:>9} {:>9} {:>9} {:>12} {:>11} {:>12}'.format(
+        'workload', 'requests', 'errors', 'req/s', 'p50 ms', 'p99 ms', 'CPU ms/req', 'peak KiB', 'pool wait ms'))
+    for name in args.workloads:
+        per_call = BATCH_SIZE if name in BATCHED else 1
+        calls = max(1, args.requests // per_call)
+        if metrics is not None:
+            metrics.clear()
+        latencies, errors, wall, cpu, pool = await run_workload(
+            base_url, name, calls, args.concurrency, client_kwargs)
+        if metrics is not None:
+            summaries.append('{}\n{}'.format(name, metrics.summary()))
+        peak = await measure_memory(base_url, name, max(1, calls // 5), args.concurrency, client_kwargs)
+        requests = calls * per_call
+        print('{:<16} {:>8} {:>7} {:>9.1f} {:>9.2f} {:>9.2f} {:>12.3f} {:>11.1f} {:>12.2f}'.format(
+            name, requests, errors, requests / wall,
+            percentile(latencies, 0.5) * 1000, percentile(latencies, 0.99) * 1000,
+            cpu / requests * 1000, peak / 1024, pool.average_wait * 1000))
+    for summary in summaries:
+        print()
+        print(summary)
+
+
+def start_stub(args):
+    command = [sys.executable, STUB_SERVER, '--port', '0', '--latency', str(args.latency),
+               '--jitter', str(args.jitter), '--error-rate', str(args.error_rate)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, universal_newlines=True)
+    return process, process.stdout.readline().strip()
+
+
+def parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=500, help='requests per workload')
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.02, help='stub server latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.01, help='stub server latency jitter in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of stub responses failing')
+    parser.add_argument('--retry', action='store_true', help='retry failed requests with the default RetryPolicy')
+    parser.add_argument('--pool-limit', type=int, help='connections per host of the Client\'s pool')
+    parser.add_argument('--metrics', action='store_true', help='report the time spent per request phase')
+    parser.add_argument('--cache-ttl', type=float, help='time to live of the Client\'s cache entries in seconds')
+    parser.add_argument('--stale', type=float, default=0,
+                        help='stale-while-revalidate and stale-if-error windows of the cache in seconds')
+    parser.add_argument('--workloads', nargs='+', default=list(WORKLOADS), choices=list(WORKLOADS))
+    return parser
+
+
+def main():
+    args = parser().parse_args()
+    process, base_url = start_stub(args)
+    try:
+        client_kwargs = {'retry': tokage.RetryPolicy(backoff=0.01)} if args.retry else {}
+        if args.pool_limit is not None:
+            client_kwargs['pool'] = tokage.PoolOptions(limit_per_host=args.pool_limit)
+        if args.metrics:
+            client_kwargs['hooks'] = tokage.Metrics()
+        if args.cache_ttl is not None:
+            client_kwargs['cache'] = functools.partial(
+                tokage.MemoryCache, ttl=args.cache_ttl, stale_while_revalidate=args.stale, stale_if_error=args.stale)
+        asyncio.run(bench(base_url, args, client_kwargs))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark the JSON decoder backends on the Jikan fixtures.
+
+For every fixture, decodes and unescapes the raw body with each installed
+backend of :mod:`tokage.decoder`, as a Client does, checks that the output is
+identical to the standard library's and reports the time per decode.
+
+Usage::
+
+    python benchmarks/bench_decoder.py [--count 500] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tokage.decoder import BACKENDS, StdlibDecoder  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def installed():
+    decoders = []
+    for name, backend in BACKENDS.items():
+        try:
+            decoders.append(backend())
+        except ImportError:
+            print('{} is not installed, skipping'.format(name))
+    return decoders
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    decoders = installed()
+    reference = StdlibDecoder()
+    print('{:<14} {:>9} '.format('fixture', 'KiB') + ' '.join('{:>10}'.format(d.name) for d in decoders)
+          + '   (us/decode)')
+    for filename in sorted(os.listdir(FIXTURES)):
+        if not filename.endswith('.json'):
+            continue
+        with open(os.path.join(FIXTURES, filename), 'rb') as f:
+            body = f.read().strip()
+        expected = reference.decode(body)
+        times = []
+        for decoder in decoders:
+            # repr also compares the types, telling 1 from 1.0
+            assert repr(decoder.decode(body)) == repr(expected), decoder.name
+            seconds = min(timeit.repeat(lambda: decoder.decode(body), number=args.count, repeat=args.repeat))
+            times.append(seconds / args.count * 1e6)
+        print('{:<14} {:>9.1f} '.format(filename[:-5], len(body) / 1024)
+              + ' '.join('{:>10.1f}'.format(t) for t in times))
+
+
+if __name__ == '__main__':
+    main()
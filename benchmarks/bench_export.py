@@ -0,0 +1,86 @@
+"""Benchmark exporting Anime objects to columnar form.
+
+Compares walking the attributes of every object into a list of dicts (what a caller
+had to do before :class:`tokage.export.Exporter`) with the Exporter's NumPy and
+Arrow conversions, and reports the peak memory of a chunked Parquet export.
+The Anime are built from the `anime.json` fixture with varied ranks and genres.
+Requires `numpy` and `pyarrow`.
+
+Usage::
+
+    python benchmarks/bench_export.py [--count 10000] [--repeat 5] [--chunk-size 1024]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tokage import Anime  # noqa: E402
+from tokage.export import Exporter  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'anime.json')
+FIELDS = ('id', 'title', 'type', 'status', 'episodes', 'airing', 'score', 'rank', 'popularity',
+          'members', 'favorites', 'genres')
+
+
+def make_anime(count):
+    with open(FIXTURE, encoding='utf-8') as f:
+        data = json.load(f)
+    genres = data['genre']
+    anime = []
+    for i in range(1, count + 1):
+        anime.append(Anime(i, dict(data, rank=i, genre=genres[i % 5:i % 5 + 3])))
+    return anime
+
+
+def walk(anime):
+    return [{name: getattr(item, name) for name in FIELDS} for item in anime]
+
+
+def report(label, seconds, repeat, count):
+    print('  {:<24} {:9.2f} ms  ({:.2f} us/object)'.format(
+        label, seconds / repeat * 1000, seconds / repeat / count * 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--chunk-size', type=int, default=1024)
+    args = parser.parse_args()
+
+    # import the optional dependencies up front, so their import is not timed
+    Exporter(Anime).to_arrow(make_anime(1))
+    Exporter(Anime).to_numpy(make_anime(1))
+
+    print('{:,} Anime'.format(args.count))
+    for label, stmt in (
+        ('attribute walk to dicts', lambda: walk(make_anime(args.count))),
+        ('Exporter.to_numpy', lambda: Exporter(Anime).to_numpy(make_anime(args.count))),
+        ('Exporter.to_arrow', lambda: Exporter(Anime).to_arrow(make_anime(args.count))),
+    ):
+        # building the objects is timed separately and subtracted
+        seconds = timeit.timeit(stmt, number=args.repeat)
+        seconds -= timeit.timeit(lambda: make_anime(args.count), number=args.repeat)
+        report(label, seconds, args.repeat, args.count)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'anime.parquet')
+        tracemalloc.start()
+        Exporter(Anime, chunk_size=args.chunk_size).write_parquet(
+            (item for chunk in range(0, args.count, args.chunk_size)
+             for item in make_anime(min(args.chunk_size, args.count - chunk))), path)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print('  chunked Parquet export peak: {:.1f} KiB traced, {:.1f} KiB written'.format(
+            peak / 1024, os.path.getsize(path) / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark eager and lazy model hydration from raw response bodies.
+
+For every fixture, compares decoding, unescaping and building the model eagerly
+(:func:`tokage.utils.decode_json` and the model class, as a Client does by default)
+with wrapping the body in a :class:`tokage.LazyPayload` and building the lazy
+model (as a Client does with `lazy=True`), then reading a single field. Reports
+the CPU time per object and the memory retained by the built objects.
+
+Usage::
+
+    python benchmarks/bench_lazy.py [--count 500] [--repeat 5]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tokage import Anime, Character, Manga, Person  # noqa: E402
+from tokage.lazy import LazyPayload, lazy_class  # noqa: E402
+from tokage.utils import decode_json  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+MODELS = (('anime', Anime, 'title'), ('manga', Manga, 'title'),
+          ('person', Person, 'name'), ('character', Character, 'name'))
+
+
+def eager(cls, field, body):
+    return getattr(cls(1, decode_json(body.decode('utf-8'))), field)
+
+
+def lazy(cls, field, body):
+    return getattr(lazy_class(cls)(1, LazyPayload(body, 'utf-8')), field)
+
+
+def retained(build, count):
+    """Bytes retained by `count` objects built by `build`."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [build() for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print('{:<10} {:>9} {:>14} {:>14} {:>9} {:>14} {:>14}'.format(
+        'fixture', 'KiB', 'eager us/obj', 'lazy us/obj', 'speedup', 'eager KiB/obj', 'lazy KiB/obj'))
+    for name, cls, field in MODELS:
+        with open(os.path.join(FIXTURES, name + '.json'), 'rb') as f:
+            body = f.read()
+        assert eager(cls, field, body) == lazy(cls, field, body)
+
+        times = {}
+        for label, fn in (('eager', eager), ('lazy', lazy)):
+            seconds = min(timeit.repeat(lambda: fn(cls, field, body), number=args.count, repeat=args.repeat))
+            times[label] = seconds / args.count * 1e6
+
+        # keep the objects, with the field read, as a caller would; every object gets its own body
+        def keep_eager():
+            obj = cls(1, decode_json(bytes(bytearray(body)).decode('utf-8')))
+            getattr(obj, field)
+            return obj
+
+        def keep_lazy():
+            obj = lazy_class(cls)(1, LazyPayload(bytes(bytearray(body)), 'utf-8'))
+            getattr(obj, field)
+            return obj
+
+        sizes = [retained(build, args.count) / args.count / 1024 for build in (keep_eager, keep_lazy)]
+        print('{:<10} {:>9.1f} {:>14.1f} {:>14.1f} {:>8.1f}x {:>14.1f} {:>14.1f}'.format(
+            name, len(body) / 1024, times['eager'], times['lazy'], times['eager'] / times['lazy'], *sizes))
+
+
+if __name__ == '__main__':
+    main()
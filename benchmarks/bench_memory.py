@@ -0,0 +1,83 @@
+"""Benchmark the memory used by resident model and partial objects.
+
+Reports bytes per object for the slotted tokage classes, next to an equivalent
+`__dict__`-based layout (the layout used before the classes were slotted, with the
+duplicated name-mangled id and state of `BasePartial`).
+
+Usage::
+
+    python benchmarks/bench_memory.py [--count 100000]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tokage import Anime, PartialAnime, PartialCharacter, PartialManga, PartialPerson  # noqa: E402
+
+ANIME = {
+    'title': 'Cowboy Bebop', 'type': 'TV', 'title_synonyms': [], 'image_url': 'image',
+    'title_japanese': 'Cowboy Bebop', 'status': 'Finished Airing', 'episodes': 26, 'airing': False,
+    'aired_string': 'Apr 3, 1998 to Apr 24, 1999', 'genre': [], 'score': 8.8, 'rank': 25,
+    'popularity': 39, 'members': 1000000, 'favorites': 50000, 'related': {},
+}
+
+
+class LegacyBasePartial:
+    def __init__(self, *args, **kwargs):
+        self.__id = kwargs.get("id")
+        self.__type = self.__class__.__name__.split("Partial")[1].lower()
+        self.__state = kwargs.get("state")
+
+
+class LegacyPartialAnime(LegacyBasePartial):
+    def __init__(self, title, id, url, **kwargs):
+        self.title = title
+        self.id = int(id)
+        self.url = url
+        self.relation = kwargs.get("relation")
+        super().__init__(id=id, state=kwargs.get("state"))
+
+
+class LegacyAnime:
+    def __init__(self, anime_id, data, **kwargs):
+        self._state = kwargs.get("state")
+        self.id = anime_id
+        for name in Anime.__slots__:
+            setattr(self, name, data.get(name))
+
+
+def per_object(factory, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # exclude the list holding the objects
+    return (after - before - sys.getsizeof(objects)) / len(objects)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+
+    url = 'https://myanimelist.net/anime/1/Cowboy_Bebop'
+    factories = (
+        ('LegacyPartialAnime', lambda i: LegacyPartialAnime('Title', i, url)),
+        ('PartialAnime', lambda i: PartialAnime('Title', i, url)),
+        ('PartialManga', lambda i: PartialManga('Title', i, url)),
+        ('PartialPerson', lambda i: PartialPerson('Name', i, url)),
+        ('PartialCharacter', lambda i: PartialCharacter('Name', i, url)),
+        ('LegacyAnime', lambda i: LegacyAnime(i, ANIME)),
+        ('Anime', lambda i: Anime(i, ANIME)),
+    )
+    for name, factory in factories:
+        print('{:<20} {:8.1f} bytes/object'.format(name, per_object(factory, args.count)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark extracting IDs from myanimelist links.
+
+Compares the previous per-link extraction (regex compiled by `re.search` on each
+call), :func:`tokage.utils.parse_id` per link (precompiled regex) and the bulk
+:func:`tokage.utils.parse_ids`, then the cost of building the voice acting roles
+of a Person with per-link and bulk extraction.
+
+Usage::
+
+    python benchmarks/bench_parse_id.py [--roles 3000] [--repeat 50]
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tokage import Person  # noqa: E402
+from tokage.person import voice_acting_role  # noqa: E402
+from tokage.utils import parse_id, parse_ids  # noqa: E402
+
+
+def legacy_parse_id(link):
+    pattern = r'(?:\/([\d]+)\/)'
+    match = re.search(pattern, link)
+    if match:
+        target_id = match.group(1)
+        return target_id
+    else:
+        return None
+
+
+def person_payload(roles):
+    return {
+        'name': 'Yamadera, Kouichi',
+        'anime_staff_position': [],
+        'published_manga': [],
+        'voice_acting_role': [
+            {'role': 'Main',
+             'anime': {'name': 'Anime %d' % i, 'url': 'https://myanimelist.net/anime/%d/Anime' % i},
+             'character': {'name': 'Character %d' % i, 'url': 'https://myanimelist.net/character/%d/Character' % i}}
+            for i in range(1, roles + 1)
+        ],
+    }
+
+
+def report(label, seconds, repeat, per):
+    print('  {:<28} {:8.3f} ms  ({:.3f} us/{})'.format(
+        label, seconds / repeat * 1000, seconds / repeat / per * 1e6, 'link'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--roles', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    data = person_payload(args.roles)
+    links = [va['character']['url'] for va in data['voice_acting_role']]
+    assert [parse_id(link) for link in links] == [legacy_parse_id(link) for link in links]
+    assert list(parse_ids(links)) == [int(legacy_parse_id(link)) for link in links]
+
+    print('{:,} links'.format(len(links)))
+    for label, stmt in (
+        ('legacy re.search per link', lambda: [int(legacy_parse_id(link)) for link in links]),
+        ('parse_id per link', lambda: [int(parse_id(link)) for link in links]),
+        ('parse_ids', lambda: parse_ids(links)),
+    ):
+        report(label, timeit.timeit(stmt, number=args.repeat), args.repeat, len(links))
+
+    print('Person with {:,} voice acting roles (2 links each)'.format(args.roles))
+    roles = data['voice_acting_role']
+    for label, stmt in (
+        ('per-link extraction', lambda: [voice_acting_role(va, None) for va in roles]),
+        ('Person.voice_acting (bulk)', lambda: Person(1, data).voice_acting),
+    ):
+        report(label, timeit.timeit(stmt, number=args.repeat), args.repeat, len(links) * 2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark JSON decoding + HTML unescaping of large Person/Character payloads.
+
+Compares the previous approach (decode, then rebuild the whole payload through a
+recursive unescape) with :func:`tokage.utils.decode_json`, reporting CPU time per
+decode and the memory allocated while decoding.
+
+Usage::
+
+    python benchmarks/bench_unescape.py [--roles 3000] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from html import unescape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tokage.utils import decode_json  # noqa: E402
+
+
+def legacy_decode(text):
+    def unescape_json(json_data):
+        if isinstance(json_data, str):
+            return unescape(json_data)
+        if isinstance(json_data, list):
+            return [unescape_json(i) for i in json_data]
+        if isinstance(json_data, dict):
+            return {
+                unescape_json(k): unescape_json(v)
+                for k, v in json_data.items()
+            }
+        return json_data
+
+    return unescape_json(json.loads(text))
+
+
+def person_payload(roles):
+    return {
+        'name': 'Yamadera, Kouichi',
+        'link_canonical': 'https://myanimelist.net/people/11/Kouichi_Yamadera',
+        'image_url': 'https://myanimelist.cdn-dena.com/images/voiceactors/2/40223.jpg',
+        'member_favorites': 12345,
+        'more': 'Hometown: Sendai &amp; Miyagi',
+        'anime_staff_position': [
+            {'role': 'Theme Song Performance',
+             'anime': {'name': 'Show %d' % i, 'url': 'https://myanimelist.net/anime/%d/Show' % i}}
+            for i in range(roles // 10)
+        ],
+        'published_manga': [],
+        'voice_acting_role': [
+            {'role': 'Main',
+             'anime': {'name': 'Anime %d' % i if i % 50 else 'Tom &amp; Jerry',
+                       'url': 'https://myanimelist.net/anime/%d/Anime' % i,
+                       'image_url': 'https://myanimelist.cdn-dena.com/images/anime/%d.jpg' % i},
+             'character': {'name': 'Character %d' % i,
+                           'url': 'https://myanimelist.net/character/%d/Character' % i,
+                           'image_url': 'https://myanimelist.cdn-dena.com/images/characters/%d.jpg' % i}}
+            for i in range(roles)
+        ],
+    }
+
+
+def character_payload(entries):
+    return {
+        'name': 'Lupin III',
+        'name_kanji': 'ルパン三世',
+        'link_canonical': 'https://myanimelist.net/character/1/Lupin',
+        'member_favorites': 999,
+        'about': 'Gentleman thief &quot;Lupin&quot;. ' * 50,
+        'animeography': [
+            {'name': 'Lupin %d' % i, 'role': 'Main', 'url': 'https://myanimelist.net/anime/%d/Lupin' % i}
+            for i in range(entries)
+        ],
+        'mangaography': [],
+        'voice_actor': [
+            {'name': 'Actor %d' % i, 'language': 'Japanese', 'url': 'https://myanimelist.net/people/%d/Actor' % i}
+            for i in range(entries // 10)
+        ],
+    }
+
+
+def measure(decode, text, repeat):
+    start = time.process_time()
+    for _ in range(repeat):
+        decode(text)
+    cpu = (time.process_time() - start) / repeat
+
+    tracemalloc.start()
+    decode(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--roles', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {
+        'person': json.dumps(person_payload(args.roles)),
+        'character': json.dumps(character_payload(args.roles)),
+    }
+    for name, text in payloads.items():
+        assert legacy_decode(text) == decode_json(text)
+        print('{} payload ({:,} bytes)'.format(name, len(text)))
+        for label, decode in (('legacy', legacy_decode), ('decode_json', decode_json)):
+            cpu, peak = measure(decode, text, args.repeat)
+            print('  {:<12} {:8.2f} ms/decode  {:10,} bytes peak'.format(label, cpu * 1000, peak))
+
+
+if __name__ == '__main__':
+    main()
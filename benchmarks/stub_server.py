@@ -0,0 +1,115 @@
+"""A local stand-in for the Jikan API, serving the synthetic fixtures in `benchmarks/fixtures`.
+
+The fixtures are written by hand in the shape of Jikan responses, not recorded from the API.
+Every ID of an endpoint gets the same fixture. Latency and upstream errors can be injected.
+
+Usage::
+
+    python benchmarks/stub_server.py [--port 8000] [--latency 0.05] [--jitter 0.01]
+                                     [--error-rate 0.0] [--error-status 503]
+
+Prints the URL to use as :class:`tokage.Client`'s `base_url` once it is listening.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+
+from aiohttp import web
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+ENDPOINTS = ('anime', 'manga', 'person', 'character')
+
+
+def load_fixtures():
+    """Load the fixtures as response bodies, keyed by endpoint or `search/<type>`."""
+    bodies = {}
+    for endpoint in ENDPOINTS:
+        with open(os.path.join(FIXTURES, endpoint + '.json'), 'rb') as f:
+            bodies[endpoint] = f.read()
+
+    with open(os.path.join(FIXTURES, 'search_anime.json'), encoding='utf-8') as f:
+        search = json.load(f)
+    bodies['search/anime'] = json.dumps(search).encode()
+    for type_ in ('manga', 'character', 'person'):
+        result = [dict(item, name=item['title'], url=item['url'].replace('/anime/', '/{}/'.format(type_)))
+                  for item in search['result']]
+        bodies['search/' + type_] = json.dumps(dict(search, result=result)).encode()
+    return bodies
+
+
+class StubServer:
+    """Serves the fixtures with the given latency (plus uniform jitter) and error rate."""
+    def __init__(self, *, latency=0.0, jitter=0.0, error_rate=0.0, error_status=503, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._bodies = load_fixtures()
+        self._runner = None
+        self.url = None
+
+    async def _respond(self, key):
+        self.requests += 1
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return web.Response(status=self.error_status)
+        return web.Response(body=self._bodies[key], content_type='application/json', charset='utf-8')
+
+    async def _entity(self, request):
+        return await self._respond(request.match_info['endpoint'])
+
+    async def _search(self, request):
+        key = 'search/' + request.match_info['type']
+        if key not in self._bodies:
+            raise web.HTTPNotFound()
+        return await self._respond(key)
+
+    async def start(self, host='127.0.0.1', port=0):
+        app = web.Application()
+        app.router.add_get('/search/{type}/{query:.*}', self._search)
+        app.router.add_get('/{endpoint:' + '|'.join(ENDPOINTS) + '}/{id}', self._entity)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = 'http://{}:{}/'.format(host, port)
+        return self.url
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+async def serve(args):
+    server = StubServer(latency=args.latency, jitter=args.jitter,
+                        error_rate=args.error_rate, error_status=args.error_status)
+    print(await server.start(args.host, args.port), flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='maximum random seconds added on top')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests failing')
+    parser.add_argument('--error-status', type=int, default=503)
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -13,5 +13,6 @@ setup(
     description='Async wrapper for the MyAnimeList API',
     url='https://github.com/SynderBlack/Tokage',
     include_package_data=True,
-    install_requires=requirements
+    install_requires=requirements,
+    python_requires='>=3.6',
 )
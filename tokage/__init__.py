@@ -1,5 +1,5 @@
 """
-Tokage is an async MAL wrapper for Python 3.5+.
+Tokage is an async MAL wrapper for Python 3.6+.
 
 .. currentmodule:: tokage
 
@@ -7,6 +7,17 @@ Tokage is an async MAL wrapper for Python 3.5+.
     :toctree: Tokage
 
     client
+    sync
+    cache
+    ratelimit
+    retry
+    pool
+    hooks
+    decoder
+    export
+    lazy
+    crawler
+    prefetch
     anime
     manga
     character
@@ -17,10 +28,23 @@ Tokage is an async MAL wrapper for Python 3.5+.
 # flake8: noqa
 
 from tokage.base import TokageBase
+from tokage.cache import BaseCache, CacheEntry, MemoryCache, SQLiteCache
 from tokage.client import Client
+from tokage.sync import SyncClient
+from tokage.retry import CircuitBreaker, RetryPolicy
+from tokage.pool import PoolOptions, PoolStats
+from tokage.hooks import Hooks, Histogram, Metrics
+from tokage.decoder import Decoder, get_decoder
+from tokage.ratelimit import PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW, RateLimiter
 from tokage.errors import *
+from tokage.identity import IdentityMap
+from tokage.index import SearchIndex
 from tokage.anime import Anime
 from tokage.manga import Manga
 from tokage.character import Character
 from tokage.person import Person
 from tokage.partial import PartialAnime, PartialManga, PartialCharacter, PartialPerson
+from tokage.export import Exporter
+from tokage.lazy import LazyPayload, LazyAnime, LazyManga, LazyPerson, LazyCharacter
+from tokage.crawler import Crawler
+from tokage.prefetch import Prefetcher
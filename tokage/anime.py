@@ -1,7 +1,8 @@
 """Anime object"""
 
 import tokage
-from tokage.utils import create_relation
+from tokage.base import cached_property, date_range, either, field
+from tokage.utils import create_relations
 
 
 class Anime(tokage.TokageBase):
@@ -92,53 +93,37 @@ class Anime(tokage.TokageBase):
 
     """
 
+    _type = 'anime'
+
+    __slots__ = (
+        'id', 'title', 'type', 'synonyms', 'image', 'japanese_title', 'status', 'episodes',
+        'airing', '_air_time', 'air_start', 'air_end', 'premiered', 'broadcast', 'synopsis',
+        'producers', 'licensors', 'studios', 'source', '_raw_genres', 'duration', 'link', 'rating',
+        'score', 'rank', 'popularity', 'members', 'favorites', '_raw_related',
+    )
+
+    _fields = {
+        'title': field('title'), 'type': field('type'), 'synonyms': field('title_synonyms'),
+        'image': field('image_url'), 'japanese_title': field('title_japanese'), 'status': field('status'),
+        'episodes': field('episodes'), 'airing': field('airing'), '_air_time': field('aired_string'),
+        'air_start': date_range('aired_string', 0), 'air_end': date_range('aired_string', 1),
+        'premiered': field('premiered'), 'broadcast': field('broadcast'), 'synopsis': field('synopsis'),
+        'producers': field('producer'), 'licensors': field('licensor'), 'studios': field('studio'),
+        'source': field('source'), '_raw_genres': either('genre', 'genres'), 'duration': field('duration'),
+        'link': field('link_canonical'), 'rating': field('rating'), 'score': field('score'),
+        'rank': field('rank'), 'popularity': field('popularity'), 'members': field('members'),
+        'favorites': field('favorites'), '_raw_related': field('related'),
+    }
+
     def __init__(self, anime_id, data, **kwargs):
-        self.id = anime_id
-        self.title = data.get('title')
-        self.type = data.get('type')
-        self.synonyms = data.get('title_synonyms')
-        self.image = data.get('image_url')
-        self.japanese_title = data.get('title_japanese')
-        self.status = data.get('status')
-        self.episodes = data.get('episodes')
-        self.airing = data.get('airing')
-
-        self._air_time = data.get('aired_string')
-        if " to " not in self._air_time:
-            self.air_start = self._air_time
-            self.air_end = None
-        else:
-            self.air_start, self.air_end = self._air_time.split(" to ")
-
-        self.premiered = data.get('premiered')
-        self.broadcast = data.get('broadcast')
-        self.synopsis = data.get('synopsis')
-        self.producers = data.get('producer')
-        self.licensors = data.get('licensor')
-        self.studios = data.get('studio')
-        self.source = data.get('source')
-        self._raw_genres = data.get('genre') or data.get('genres')
-        self.duration = data.get('duration')
-        self.link = data.get('link_canonical')
-        self.rating = data.get('rating')
-        self.score = data.get('score')
-        self.rank = data.get('rank')
-        self.popularity = data.get('popularity')
-        self.members = data.get('members')
-        self.favorites = data.get('favorites')
-        self._raw_related = data.get('related')
+        self.id = int(anime_id)
+        self._hydrate(data)
         super().__init__(state=kwargs.get("state"))
 
-    @property
+    @cached_property
     def genres(self):
         return [g['name'] for g in self._raw_genres] if self._raw_genres else None
 
-    @property
+    @cached_property
     def related(self):
-        lst = []
-        for relation_type, relations in self._raw_related.items():
-            for relation in relations:
-                relation['relation'] = relation_type
-                obj = create_relation(relation, self._state)
-                lst.append(obj)
-        return lst
+        return create_relations(self._raw_related, self._state)
@@ -0,0 +1,90 @@
+"""Async primitives for the supported async libraries"""
+
+
+class AsyncLib:
+    """Thin wrapper giving the Client the same primitives under `asyncio` and `multio`."""
+    def __init__(self, lib):
+        self.lib = lib
+        if lib == 'asyncio':
+            import asyncio
+            self._mod = asyncio
+        else:
+            import multio
+            self._mod = multio
+
+    def event(self):
+        return self._mod.Event()
+
+    def lock(self):
+        return self._mod.Lock()
+
+    def spawn(self, coro):
+        """Run a coroutine in the background and return its task. Only supported under `asyncio`."""
+        if self.lib != 'asyncio':
+            raise NotImplementedError("background tasks are only supported under asyncio")
+        return self._mod.ensure_future(coro)
+
+    async def run_in_executor(self, executor, fn, *args):
+        """Call `fn` in a `concurrent.futures` executor and wait for its result.
+
+        Under `multio`, the calling task blocks until the call returns.
+        """
+        future = executor.submit(fn, *args)
+        if self.lib == 'asyncio':
+            return await self._mod.wrap_future(future)
+        return future.result()
+
+    async def sleep(self, seconds):
+        if self.lib == 'asyncio':
+            await self._mod.sleep(seconds)
+        else:
+            await self._mod.asynclib.sleep(seconds)
+
+    async def map_unordered(self, fn, items, limit):
+        """Call `fn` on every item with at most `limit` calls running at once.
+
+        Yields `(index, result)` tuples, where `result` is the exception raised by the
+        call if it failed. Under `asyncio` results are yielded as they complete; under
+        `multio` they are yielded per window of `limit` items.
+        """
+        items = list(items)
+        if not items:
+            return
+        limit = max(1, min(limit, len(items)))
+
+        async def call(item):
+            try:
+                return await fn(item)
+            except Exception as e:
+                return e
+
+        if self.lib == 'asyncio':
+            queue = self._mod.Queue()
+            pending = iter(enumerate(items))
+
+            async def worker():
+                for index, item in pending:
+                    queue.put_nowait((index, await call(item)))
+
+            workers = [self._mod.ensure_future(worker()) for _ in range(limit)]
+            try:
+                for _ in items:
+                    yield await queue.get()
+            finally:
+                for task in workers:
+                    task.cancel()
+            return
+
+        asynclib = self._mod.asynclib
+        for start in range(0, len(items), limit):
+            window = items[start:start + limit]
+            results = [None] * len(window)
+
+            async def run(offset, item):
+                results[offset] = await call(item)
+
+            async with asynclib.task_manager() as manager:
+                for offset, item in enumerate(window):
+                    await asynclib.spawn(manager, run, offset, item)
+            for offset, result in enumerate(results):
+                yield start + offset, result
@@ -1,6 +1,118 @@
 """Base class for content types"""
 
+_slot_names = {}
+
+
+def slot_names(cls):
+    """Get every slot name defined along the MRO of `cls`."""
+    try:
+        return _slot_names[cls]
+    except KeyError:
+        names = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            names.extend(name for name in slots if name not in names)
+        names = _slot_names[cls] = tuple(names)
+        return names
+
+
+class cached_property:
+    """A property computed once per instance, for slotted classes.
+
+    Values are kept in the `_cache` slot of :class:`TokageBase` until :meth:`TokageBase.invalidate` is called.
+    """
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        cache = obj._cache
+        if cache is None:
+            cache = obj._cache = {}
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.func(obj)
+            return value
+
+
+def field(key):
+    """Load the value of a payload key."""
+    return lambda data: data.get(key)
+
+
+def first(key):
+    """Load the first item of the list under a payload key."""
+    return lambda data: data.get(key)[0]
+
+
+def either(key, other):
+    """Load the value of a payload key, falling back to another key if it is empty."""
+    return lambda data: data.get(key) or data.get(other)
+
+
+def date_range(key, index):
+    """Load the start (`index` 0) or end (`index` 1) of a date range such as `Apr 1998 to Apr 1999`."""
+    def load(data):
+        text = data.get(key)
+        if text is None or " to " not in text:
+            return (text, None)[index]
+        return text.split(" to ")[index]
+    return load
+
 
 class TokageBase:
+    __slots__ = ('_state', '_cache', '__weakref__')
+    # maps attribute names to the functions loading them from a payload, shared by the eager and lazy models
+    _fields = {}
+    _partial = False
+
     def __init__(self, *args, **kwargs):
         self._state = kwargs.get("state")
+        self._cache = None
+
+    def _hydrate(self, data):
+        """Set the attributes of :attr:`_fields` from a payload."""
+        for name, load in self._fields.items():
+            setattr(self, name, load(data))
+
+    def invalidate(self, *names):
+        """Drop cached derived attributes, such as `related`, so they are rebuilt on next access.
+
+        Drops the given attribute names, or every cached attribute if none are given.
+        """
+        if self._cache is None:
+            return
+        if not names:
+            self._cache = None
+            return
+        for name in names:
+            self._cache.pop(name, None)
+
+    def __eq__(self, other):
+        if not isinstance(other, TokageBase):
+            return NotImplemented
+        # lazy models are equal to their eager counterpart, partials are only equal to partials
+        return self._type == other._type and self._partial is other._partial and self.id == other.id
+
+    def __hash__(self):
+        return hash((self._type, self.id))
+
+    def __getstate__(self):
+        # the Client is not picklable, unpickled objects are detached from it
+        state = {}
+        for name in slot_names(type(self)):
+            if name not in ('_state', '_cache', '__weakref__') and hasattr(self, name):
+                state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        self._state = None
+        self._cache = None
+        for name, value in state.items():
+            setattr(self, name, value)
@@ -0,0 +1,459 @@
+"""Response caches for the Client"""
+
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from tokage.decoder import StdlibDecoder
+
+__all__ = ('CacheEntry', 'BaseCache', 'MemoryCache', 'SQLiteCache')
+
+
+_STDLIB = StdlibDecoder()
+
+
+class CacheEntry:
+    """A single cached response.
+
+    Attributes
+    ----------
+    data : Union[dict, list]
+        The decoded, unescaped JSON payload.
+
+    size : int
+        Size of the response body in bytes.
+
+    expires : float
+        Unix timestamp after which the entry is no longer fresh.
+
+    etag : Optional[str]
+        The `ETag` header of the response, used to revalidate the entry once expired.
+
+    last_modified : Optional[str]
+        The `Last-Modified` header of the response, used to revalidate the entry once expired.
+
+    """
+    __slots__ = ('data', 'size', 'expires', 'etag', 'last_modified')
+
+    def __init__(self, data, size, expires, etag=None, last_modified=None):
+        self.data = data
+        self.size = size
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def expired(self):
+        return time.time() >= self.expires
+
+    def validators(self):
+        """Get the conditional request headers revalidating this entry, or None if it has no validators."""
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers or None
+
+
+class BaseCache:
+    """Interface for the response cache backends used by :class:`Client`.
+
+    Backends store :class:`CacheEntry` objects keyed by request URL. Freshness is
+    decided with per-endpoint TTLs, where the endpoint is the first path segment of
+    the Jikan URL (`anime`, `manga`, `person`, `character` or `search`).
+
+    Parameters
+    ----------
+    ttl : Optional[float]
+        Default time to live of an entry, in seconds. Defaults to one hour.
+
+    ttls : Optional[dict]
+        Mapping of endpoint to time to live, overriding `ttl` for that endpoint.
+
+    stale_while_revalidate : Optional[float]
+        Seconds past expiry during which an entry is returned immediately, while a single
+        background request refreshes it. Only applies under `asyncio`. Defaults to 0, which
+        makes callers wait for the refresh.
+
+    stale_if_error : Optional[float]
+        Seconds past expiry during which an entry is returned when refreshing it fails,
+        instead of raising the Error. Defaults to 0, which always raises.
+
+    Attributes
+    ----------
+    hits : int
+        Amount of lookups which returned a fresh entry.
+
+    misses : int
+        Amount of lookups which found no entry, or an expired one.
+
+    evictions : int
+        Amount of entries dropped to respect the size bounds.
+
+    revalidations : int
+        Amount of expired entries the API confirmed as unchanged (`304 Not Modified`).
+
+    stale_hits : int
+        Amount of expired entries returned while being refreshed in the background.
+        They are also counted in :attr:`misses`.
+
+    stale_errors : int
+        Amount of expired entries returned because refreshing them failed.
+
+    """
+    def __init__(self, *, ttl=3600, ttls=None, stale_while_revalidate=0, stale_if_error=0):
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self.stale_hits = 0
+        self.stale_errors = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def ttl_for(self, endpoint):
+        """Get the time to live for an endpoint."""
+        return self.ttls.get(endpoint, self.ttl)
+
+    def make_entry(self, endpoint, data, size, etag=None, last_modified=None):
+        """Create a :class:`CacheEntry` expiring after the endpoint's TTL."""
+        return CacheEntry(data, size, time.time() + self.ttl_for(endpoint), etag, last_modified)
+
+    def _bind(self, client):
+        pass
+
+    def _record(self, entry):
+        if entry is None or entry.expired:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    async def get(self, key):
+        """Get the entry stored for `key`, or None.
+
+        Expired entries are still returned; callers should check :attr:`CacheEntry.expired`.
+        """
+        raise NotImplementedError
+
+    async def is_fresh(self, key):
+        """Whether a fresh entry is stored for `key`.
+
+        Unlike :meth:`get`, it is not counted in the statistics and does not count as a use of the entry.
+        """
+        raise NotImplementedError
+
+    async def set(self, key, entry, body=None, encoding='utf-8'):
+        """Store an entry for `key`, replacing any previous one.
+
+        `body` is the raw response body of the entry, in the given `encoding`, for backends
+        storing serialized entries. It is omitted when only the expiry and validators of a
+        stored entry changed.
+        """
+        raise NotImplementedError
+
+    async def delete(self, key):
+        """Remove the entry stored for `key`, if any."""
+        raise NotImplementedError
+
+    async def clear(self):
+        """Remove every entry."""
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """An in-memory, LRU-bounded :class:`BaseCache`.
+
+    Parameters
+    ----------
+    max_entries : Optional[int]
+        Maximum amount of stored entries. Defaults to 1024. `None` means unbounded.
+
+    max_bytes : Optional[int]
+        Maximum total size of the stored response bodies. Defaults to unbounded.
+
+    ttl : Optional[float]
+        See :class:`BaseCache`.
+
+    ttls : Optional[dict]
+        See :class:`BaseCache`.
+
+    stale_while_revalidate : Optional[float]
+        See :class:`BaseCache`.
+
+    stale_if_error : Optional[float]
+        See :class:`BaseCache`.
+
+    """
+    def __init__(self, *, max_entries=1024, max_bytes=None, **kwargs):
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return self._record(entry)
+
+    async def is_fresh(self, key):
+        entry = self._entries.get(key)
+        return entry is not None and not entry.expired
+
+    async def set(self, key, entry, body=None, encoding='utf-8'):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old.size
+        self._entries[key] = entry
+        self.total_bytes += entry.size
+        self._evict()
+
+    async def delete(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+
+    async def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def _evict(self):
+        entries = self._entries
+        while entries and (
+            (self.max_entries is not None and len(entries) > self.max_entries) or
+            (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            _, entry = entries.popitem(last=False)
+            self.total_bytes -= entry.size
+            self.evictions += 1
+
+
+class SQLiteCache(BaseCache):
+    """A persistent :class:`BaseCache` stored in an SQLite database in WAL mode.
+
+    Opening the database does not scan it: the amount of entries and their total size
+    are kept up to date by triggers, so a new process is warm as soon as it starts.
+    Least recently used entries are evicted to respect the size bounds.
+
+    Expired entries are kept for `retention` seconds so they can still be revalidated,
+    and are removed by :meth:`compact`.
+
+    Entries are stored as the raw response bodies, and decoded as the :class:`Client`
+    decodes responses when read. The database is only accessed from a dedicated worker
+    thread: under `asyncio`, the event loop does not wait for it.
+
+    Parameters
+    ----------
+    path : str
+        Path of the database file. It is created if it does not exist.
+
+    max_entries : Optional[int]
+        Maximum amount of stored entries. Defaults to unbounded.
+
+    max_bytes : Optional[int]
+        Maximum total size of the stored response bodies. Defaults to 256 MiB.
+
+    retention : Optional[float]
+        Seconds expired entries are kept for. Defaults to one day. Expired entries
+        are only served stale while they are kept.
+
+    ttl : Optional[float]
+        See :class:`BaseCache`.
+
+    ttls : Optional[dict]
+        See :class:`BaseCache`.
+
+    stale_while_revalidate : Optional[float]
+        See :class:`BaseCache`.
+
+    stale_if_error : Optional[float]
+        See :class:`BaseCache`.
+
+    """
+    # bumped when the layout changes: databases with another version are rebuilt
+    _SCHEMA_VERSION = 1
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        body BLOB NOT NULL,
+        encoding TEXT,
+        size INTEGER NOT NULL,
+        expires REAL NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        accessed REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+    CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires);
+    CREATE TABLE IF NOT EXISTS totals (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        entries INTEGER NOT NULL,
+        bytes INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO totals VALUES (0, 0, 0);
+    CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+        UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size;
+    END;
+    CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+        UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size;
+    END;
+    CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses BEGIN
+        UPDATE totals SET bytes = bytes - OLD.size + NEW.size;
+    END;
+    """
+
+    def __init__(self, path, *, max_entries=None, max_bytes=256 * 1024 * 1024, retention=86400, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.retention = retention
+        self._async = None
+        self._decode = _STDLIB.decode
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tokage-sqlite')
+        self._db = self._call(self._connect)
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        if db.execute('PRAGMA user_version').fetchone()[0] != self._SCHEMA_VERSION:
+            db.executescript('DROP TABLE IF EXISTS responses; DROP TABLE IF EXISTS totals;')
+        db.executescript(self._SCHEMA)
+        db.execute('PRAGMA user_version = {}'.format(self._SCHEMA_VERSION))
+        return db
+
+    def _bind(self, client):
+        self._async = client._async
+        self._decode = client._decode_body
+
+    def _call(self, fn, *args):
+        """Call `fn` in the worker thread and wait for its result."""
+        return self._executor.submit(fn, *args).result()
+
+    async def _run(self, fn, *args):
+        """Call `fn` in the worker thread, waiting for its result without blocking the event loop."""
+        if self._async is None:
+            return self._call(fn, *args)
+        return await self._async.run_in_executor(self._executor, fn, *args)
+
+    def __len__(self):
+        return self._call(self._totals)[0]
+
+    @property
+    def total_bytes(self):
+        return self._call(self._totals)[1]
+
+    def _totals(self):
+        return self._db.execute('SELECT entries, bytes FROM totals').fetchone()
+
+    async def get(self, key):
+        row = await self._run(self._get, key)
+        entry = None
+        if row is not None:
+            body, encoding, size, expires, etag, last_modified = row
+            # entries stored without a body hold their unescaped payload as JSON
+            data = json.loads(body) if encoding is None else self._decode(body, encoding)
+            entry = CacheEntry(data, size, expires, etag, last_modified)
+        return self._record(entry)
+
+    def _get(self, key):
+        row = self._db.execute(
+            'SELECT body, encoding, size, expires, etag, last_modified FROM responses WHERE key = ?', (key,)
+        ).fetchone()
+        if row is not None:
+            self._db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (time.time(), key))
+        return row
+
+    async def is_fresh(self, key):
+        return await self._run(self._is_fresh, key)
+
+    def _is_fresh(self, key):
+        row = self._db.execute('SELECT expires FROM responses WHERE key = ?', (key,)).fetchone()
+        return row is not None and time.time() < row[0]
+
+    async def set(self, key, entry, body=None, encoding='utf-8'):
+        await self._run(self._set, key, entry, body, encoding)
+
+    def _set(self, key, entry, body, encoding):
+        if body is None:
+            # only the expiry and validators changed: keep the stored body
+            updated = self._db.execute(
+                'UPDATE responses SET size = ?, expires = ?, etag = ?, last_modified = ?, accessed = ? '
+                'WHERE key = ?',
+                (entry.size, entry.expires, entry.etag, entry.last_modified, time.time(), key)
+            ).rowcount
+            if updated:
+                return
+            # mappings such as lazy payloads are stored unescaped, as plain objects
+            body = json.dumps(entry.data, ensure_ascii=False, separators=(',', ':'), default=dict).encode('utf-8')
+            encoding = None
+        self._db.execute(
+            'INSERT INTO responses (key, body, encoding, size, expires, etag, last_modified, accessed) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET body = excluded.body, '
+            'encoding = excluded.encoding, size = excluded.size, expires = excluded.expires, '
+            'etag = excluded.etag, last_modified = excluded.last_modified, accessed = excluded.accessed',
+            (key, body, encoding, entry.size, entry.expires, entry.etag, entry.last_modified, time.time())
+        )
+        self._evict()
+
+    async def delete(self, key):
+        await self._run(self._db.execute, 'DELETE FROM responses WHERE key = ?', (key,))
+
+    async def clear(self):
+        await self._run(self._db.execute, 'DELETE FROM responses')
+
+    def _evict(self):
+        while True:
+            entries, total = self._totals()
+            excess = 0
+            if self.max_entries is not None and entries > self.max_entries:
+                excess = entries - self.max_entries
+            if self.max_bytes is not None and total > self.max_bytes and entries:
+                # estimate from the average entry size, rounding up
+                excess = max(excess, -(-(total - self.max_bytes) * entries // total))
+            if not excess:
+                return
+            deleted = self._db.execute(
+                'DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed LIMIT ?)',
+                (excess,)
+            ).rowcount
+            self.evictions += deleted
+
+    def compact(self, *, vacuum=False):
+        """Remove entries expired for longer than `retention`, enforce the size bounds and checkpoint the WAL.
+
+        With `vacuum`, the database file is also rebuilt to give freed space back to the filesystem.
+        Returns the amount of removed expired entries.
+        """
+        return self._call(self._compact, vacuum)
+
+    def _compact(self, vacuum):
+        removed = self._db.execute(
+            'DELETE FROM responses WHERE expires < ?', (time.time() - self.retention,)
+        ).rowcount
+        self._evict()
+        if vacuum:
+            self._db.execute('VACUUM')
+        self._db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        return removed
+
+    def close(self):
+        """Close the database and stop the worker thread."""
+        self._call(self._db.close)
+        self._executor.shutdown()
@@ -1,8 +1,9 @@
 """Character object"""
 
 import tokage
+from tokage.base import cached_property, either, field
 from tokage.partial import PartialAnime, PartialManga, PartialPerson
-from tokage.utils import parse_id
+from tokage.utils import parse_ids
 
 
 class Character(tokage.TokageBase):
@@ -42,43 +43,45 @@ class Character(tokage.TokageBase):
 
     """
 
+    _type = 'character'
+
+    __slots__ = (
+        'id', 'link', 'name', 'image', 'favorites', '_raw_animeography', '_raw_mangaography',
+        'japanese_name', 'about', '_raw_voice_actors',
+    )
+
+    _fields = {
+        'link': field('link_canonical'), 'name': field('name'), 'image': field('image_url'),
+        'favorites': field('member_favorites'), '_raw_animeography': field('animeography'),
+        '_raw_mangaography': field('mangaography'), 'japanese_name': field('name_kanji'),
+        'about': field('about'), '_raw_voice_actors': either('voice_actors', 'voice_actor'),
+    }
+
     def __init__(self, char_id, data, **kwargs):
-        self.id = char_id
-        self.link = data.get('link_canonical')
-        self.name = data.get('name')
-        self.image = data.get('image_url')
-        self.favorites = data.get('member_favorites')
-        self._raw_animeography = data.get('animeography')
-        self._raw_mangaography = data.get('mangaography')
-        self.japanese_name = data.get('name_kanji')
-        self.about = data.get('about')
-        self._raw_voice_actors = data.get('voice_actors') or data.get('voice_actor')
+        self.id = int(char_id)
+        self._hydrate(data)
         super().__init__(state=kwargs.get("state"))
-        print(self._state)
 
-    @property
+    @cached_property
     def animeography(self):
-        lst = []
-        for anime in self._raw_animeography:
-            anime['mal_id'] = parse_id(anime['url'])
-            obj = PartialAnime.from_character(anime, state=self._state)
-            lst.append(obj)
-        return lst
-
-    @property
+        raw = self._raw_animeography
+        return [
+            PartialAnime.interned(anime['name'], id, anime['url'], state=self._state)
+            for anime, id in zip(raw, parse_ids([anime['url'] for anime in raw]))
+        ]
+
+    @cached_property
     def mangaography(self):
-        lst = []
-        for manga in self._raw_mangaography:
-            manga['mal_id'] = parse_id(manga['url'])
-            obj = PartialManga.from_character(manga, state=self._state)
-            lst.append(obj)
-        return lst
-
-    @property
+        raw = self._raw_mangaography
+        return [
+            PartialManga.interned(manga['name'], id, manga['url'], state=self._state)
+            for manga, id in zip(raw, parse_ids([manga['url'] for manga in raw]))
+        ]
+
+    @cached_property
     def voice_actors(self):
-        lst = []
-        for va in self._raw_voice_actors:
-            va['mal_id'] = parse_id(va['url'])
-            obj = PartialPerson.from_voice_acting(va, state=self._state)
-            lst.append(obj)
-        return lst
+        raw = self._raw_voice_actors
+        return [
+            PartialPerson.interned(va['name'], id, va['url'], language=va.get('language'), state=self._state)
+            for va, id in zip(raw, parse_ids([va['url'] for va in raw]))
+        ]
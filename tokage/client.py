@@ -1,14 +1,26 @@
-import json
-from html.parser import HTMLParser
-from urllib.parse import parse_qs
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, quote
 
 from lxml import etree
 
 from tokage.anime import Anime
+from tokage.asynclib import AsyncLib
+from tokage.cache import MemoryCache
 from tokage.character import Character
+from tokage.decoder import Decoder, get_decoder
 from tokage.errors import *  # noqa
+from tokage.hooks import Metrics
+from tokage.identity import IdentityMap
+from tokage.lazy import LazyPayload, lazy_class
+from tokage.index import SearchIndex
 from tokage.manga import Manga
-from tokage.person import Person
+from tokage.person import Person, anime_position, manga_position, voice_acting_role
+from tokage.prefetch import Prefetcher
+from tokage.pool import PoolOptions, PoolStats, _pool_counts, _WaitTracker
+from tokage.ratelimit import PRIORITY_LOW, PRIORITY_NORMAL, RateLimiter
+from tokage.retry import CircuitBreaker, RetryPolicy, parse_retry_after
+from tokage.stream import ArrayNotFound, iter_json_array
 from tokage.utils import parse_id
 from tokage.partial import *  # noqa
 
@@ -19,6 +31,34 @@ PERSON_URL = BASE_URL + 'person/'
 CHARACTER_URL = BASE_URL + 'character/'
 SEARCH_URL = BASE_URL + 'search/'
 
+STREAM_CHUNK_SIZE = 16384
+SEARCH_ID_CACHE_SIZE = 4096
+
+
+def _result_url(node):
+    """Get the link of a google result from an `<a>` element, or None if it is not one."""
+    parent = node.getparent()
+    if parent is None or parent.tag != 'h3':
+        return None
+    url = node.get('href', '')
+    if not url.startswith('/url?'):
+        return None
+    for div in node.iterancestors('div'):
+        if div.get('class') == 'g':
+            return url
+    return None
+
+
+class _Flight:
+    """An upstream request shared by concurrent callers of the same URL."""
+    __slots__ = ('event', 'done', 'result', 'error')
+
+    def __init__(self, event):
+        self.event = event
+        self.done = False
+        self.result = None
+        self.error = None
+
 
 class Client:
     """Client connection to the MAL API.
@@ -43,169 +83,746 @@ class Client:
 
         Defaults to creating a new one.
 
+    cache : Optional[Union[:class:`BaseCache`, bool]]
+
+        The response cache to use. Pass `True` to use a default :class:`MemoryCache`.
+
+        Defaults to no caching.
+
+    rate_limit : Optional[Union[:class:`RateLimiter`, bool]]
+
+        The rate limiter pacing upstream requests. Pass `True` to use a default
+        :class:`RateLimiter` matching Jikan's limits.
+
+        Defaults to no rate limiting.
+
+    retry : Optional[Union[:class:`RetryPolicy`, bool]]
+
+        The policy for retrying failed requests. Pass `True` to use a default :class:`RetryPolicy`.
+
+        Defaults to making a single attempt.
+
+    circuit_breaker : Optional[Union[:class:`CircuitBreaker`, bool]]
+
+        The circuit breaker failing requests fast while the API is unhealthy.
+        Pass `True` to use a default :class:`CircuitBreaker`.
+
+        Defaults to none.
+
+    identity_map : Optional[bool]
+
+        Whether to keep an :class:`IdentityMap`, so that partials with the same type and ID
+        are a single object across responses. Partials with response-specific attributes
+        (such as `relation`) are a single object per type, ID and attributes, linked to that
+        object. Defaults to `False`.
+
+    base_url : Optional[str]
+
+        The Jikan API root to use, for example a self-hosted Jikan instance.
+
+        Defaults to the public Jikan API.
+
+    search_index : Optional[Union[:class:`SearchIndex`, bool]]
+
+        A local index of seen titles and names, answering `search_*` calls without a round trip
+        when it has good matches. Pass `True` to use a default :class:`SearchIndex`.
+
+        Defaults to always searching through the API.
+
+    pool : Optional[Union[:class:`PoolOptions`, bool]]
+
+        The connection pool settings of the session created by the Client, which also makes
+        it time the waits for a free connection (see :meth:`pool_stats`).
+        Pass `True` to use default :class:`PoolOptions`. Cannot be used with `session`.
+
+        Defaults to the async library's own defaults.
+
+    hooks : Optional[Union[:class:`Hooks`, bool]]
+
+        Callbacks around the phases of every request. Pass `True` to collect :class:`Metrics`.
+
+        Defaults to none, which adds no overhead.
+
+    lazy : Optional[bool]
+
+        Whether to keep responses undecoded until they are read. Payloads are then
+        :class:`LazyPayload` mappings which decode on first access and unescape fields as
+        they are read, and the `get_*` methods return lazy subclasses of the models
+        (such as :class:`LazyAnime`) which load each attribute on first access.
+        Defaults to `False`.
+
+    decoder : Optional[Union[:class:`Decoder`, str]]
+
+        The JSON decoder of response bodies, or the name of its backend (`orjson`, `simdjson`,
+        `ujson` or `json`). Every backend gives the same output.
+
+        Defaults to the fastest installed backend, see :func:`get_decoder`.
+
+    prefetch : Optional[Union[:class:`Prefetcher`, bool]]
+
+        Warms the cache in the background with the entities linked to retrieved ones.
+        Pass `True` to use a default :class:`Prefetcher`. Requires a cache and `asyncio`.
+
+        Defaults to no prefetching.
+
     Attributes
     ----------
     session : Union[aiohttp.ClientSession, asks.Session]
 
         The session used for aiohttp/asks HTTP requests.
 
+    cache : Optional[:class:`BaseCache`]
+
+        The response cache, if any.
+
+    rate_limit : Optional[:class:`RateLimiter`]
+
+        The rate limiter, if any.
+
+    retry : Optional[:class:`RetryPolicy`]
+
+        The retry policy, if any.
+
+    circuit_breaker : Optional[:class:`CircuitBreaker`]
+
+        The circuit breaker, if any.
+
+    identity_map : Optional[:class:`IdentityMap`]
+
+        The identity map, if any.
+
+    base_url : str
+
+        The Jikan API root requests are made to.
+
+    search_index : Optional[:class:`SearchIndex`]
+
+        The local search index, if any.
+
+    pool : Optional[:class:`PoolOptions`]
+
+        The connection pool settings, if any.
+
+    hooks : Optional[:class:`Hooks`]
+
+        The request lifecycle hooks, if any.
+
+    decoder : :class:`Decoder`
+
+        The JSON decoder.
+
+    prefetcher : Optional[:class:`Prefetcher`]
+
+        The prefetcher, if any.
+
     """
-    def __init__(self, session=None, *, lib='asyncio', loop=None):
+    def __init__(self, session=None, *, lib='asyncio', loop=None, cache=None, rate_limit=None,
+                 retry=None, circuit_breaker=None, identity_map=False, base_url=BASE_URL, search_index=None,
+                 pool=None, hooks=None, lazy=False, decoder=None, prefetch=None):
         if lib not in ('asyncio', 'multio'):
             raise ValueError("lib must be of type `str` and be either `asyncio` or `multio`, "
                              "not `{}`".format(lib if isinstance(lib, str) else lib.__class__.__name__))
         self._lib = lib
+        self.base_url = base_url if base_url.endswith('/') else base_url + '/'
         if lib == 'asyncio':
             import asyncio
             loop = loop or asyncio.get_event_loop()
+        if pool is True:
+            pool = PoolOptions()
+        self.pool = pool or None
+        if session is not None and self.pool is not None:
+            raise ValueError("pool options only apply to sessions created by the Client, "
+                             "configure the given session instead")
+        # caches have a length, so an empty one is falsy
+        if prefetch not in (None, False) and (lib != 'asyncio' or cache is None or cache is False):
+            raise ValueError("prefetching requires the `asyncio` library and a cache")
+        self._pool_waits = None
         self.session = session or self._make_session(lib, loop)
-        self._html_parser = HTMLParser()
-
-    @staticmethod
-    def _make_session(lib, loop=None):
+        self._async = AsyncLib(lib)
+        self._inflight = {}
+        self._refreshing = {}
+        self._search_ids = OrderedDict()
+        if cache is True:
+            cache = MemoryCache()
+        self.cache = cache if cache is not False else None
+        if self.cache is not None:
+            self.cache._bind(self)
+        if rate_limit is True:
+            rate_limit = RateLimiter()
+        self.rate_limit = rate_limit or None
+        if self.rate_limit is not None:
+            self.rate_limit._bind(self._async)
+        self.retry = RetryPolicy() if retry is True else retry or None
+        self.circuit_breaker = CircuitBreaker() if circuit_breaker is True else circuit_breaker or None
+        self._network_errors = self._get_network_errors(lib)
+        self._upstream_errors = (RequestFailed,) + self._network_errors
+        self.identity_map = IdentityMap() if identity_map else None
+        if search_index is True:
+            search_index = SearchIndex()
+        # an empty SearchIndex is falsy, as it has a length
+        self.search_index = search_index if search_index is not False else None
+        self.hooks = Metrics() if hooks is True else hooks or None
+        self.lazy = lazy
+        self.decoder = decoder if isinstance(decoder, Decoder) else get_decoder(decoder)
+        self.prefetcher = Prefetcher() if prefetch is True else prefetch or None
+        if self.prefetcher is not None:
+            self.prefetcher._bind(self)
+
+    def _make_session(self, lib, loop=None):
+        pool = self.pool
         if lib == 'asyncio':
             try:
                 import aiohttp
             except ImportError:
                 raise ImportError("To use tokage in asyncio mode, it requires the `aiohttp` module.")
-            return aiohttp.ClientSession(loop=loop)
+            if pool is None:
+                return aiohttp.ClientSession(loop=loop)
+            self._pool_waits = _WaitTracker()
+            return aiohttp.ClientSession(loop=loop, trace_configs=[self._pool_waits.trace_config()],
+                                         **pool.aiohttp_kwargs(loop))
         try:
             import asks
         except ImportError:
             raise ImportError("To use tokage in curio/trio mode, it requires the `asks` module.")
-        return asks.Session()
+        if pool is None:
+            return asks.Session()
+        return asks.Session(**pool.asks_kwargs())
+
+    @staticmethod
+    def _get_network_errors(lib):
+        if lib == 'asyncio':
+            import asyncio
+            import aiohttp
+            return (OSError, asyncio.TimeoutError, aiohttp.ClientError)
+        import asks
+        return (OSError, asks.errors.AsksException)
 
     async def cleanup(self):
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
+        for task in list(self._refreshing.values()):
+            task.cancel()
         if self._lib == 'asyncio':
             await self.session.close()
 
-    async def _json(self, resp, encoding=None):
-        """Read, decodes and unescapes a JSON `aiohttp.ClientResponse` object."""
-        def unescape_json(json_data):
-            if isinstance(json_data, str):
-                return self._html_parser.unescape(json_data)
-            if isinstance(json_data, list):
-                return [unescape_json(i) for i in json_data]
-            if isinstance(json_data, dict):
-                return {
-                    unescape_json(k): unescape_json(v)
-                    for k, v in json_data.items()
-                }
-            return json_data
+    def pool_stats(self):
+        """Get a :class:`PoolStats` snapshot of the session's connection pool.
 
+        Wait times are only tracked for `aiohttp` sessions created with `pool` options;
+        they are zero otherwise.
+        """
+        limit, in_use, idle, waiting = _pool_counts(self._lib, self.session)
+        waits = self._pool_waits
+        if waits is None:
+            return PoolStats(limit, in_use, idle, waiting, 0, 0.0, 0.0)
+        return PoolStats(limit, in_use, idle, waiting, waits.waits, waits.total_wait, waits.max_wait)
+
+    def _status(self, resp):
+        return resp.status if self._lib == 'asyncio' else resp.status_code
+
+    @staticmethod
+    def _header(resp, name):
+        return resp.headers.get(name) or resp.headers.get(name.lower())
+
+    def _release(self, resp):
+        """Give the connection of an unread response back to the pool."""
         if self._lib == 'asyncio':
-            if resp._content is None:
-                await resp.read()
-                stripped = resp._content.strip()
-        else:
-            stripped = resp.content.strip()
+            resp.release()
 
-        if not stripped:
-            return None
+    async def _read(self, resp):
+        """Read the stripped body of a response."""
+        if self._lib == 'asyncio':
+            return (await resp.read()).strip()
+        return resp.content.strip()
 
-        if encoding is None:
-            if self._lib == 'asyncio':
-                encoding = resp._get_encoding()
-            else:
-                encoding = resp.encoding
+    def _encoding(self, resp):
+        if self._lib == 'asyncio':
+            return resp.get_encoding()
+        return resp.encoding
+
+    def _decode(self, resp, body):
+        """Decode and unescape a JSON response body, or wrap it in a :class:`LazyPayload` in lazy mode."""
+        return self._decode_body(body, self._encoding(resp))
 
-        json_resp = json.loads(stripped.decode(encoding))
+    def _decode_body(self, body, encoding):
+        if self.lazy:
+            return LazyPayload(body, encoding, self.decoder)
+        return self.decoder.decode(body, encoding)
 
-        return unescape_json(json_resp)
+    def _endpoint(self, url):
+        """Get the endpoint name (`anime`, `search`, ...) of a Jikan URL."""
+        return url[len(self.base_url):].split('/', 1)[0]
 
-    async def request(self, url):
-        resp = await self.session.get(url)
-        return await self._json(resp)
+    async def request(self, url, *, priority=PRIORITY_NORMAL):
+        """Request a Jikan URL and return the decoded payload, or None if the response was empty.
+
+        `priority` is the :class:`RateLimiter` lane the request waits in, if it has to wait.
+        """
+        hooks = self.hooks
+        if hooks is not None:
+            endpoint = self._endpoint(url)
+            start = time.perf_counter()
+            hooks.on_request_start(endpoint, url)
+        error = None
+        try:
+            entry = None
+            cache = self.cache
+            if cache is not None:
+                entry = await cache.get(url)
+                if entry is not None:
+                    if not entry.expired:
+                        if hooks is not None:
+                            hooks.on_cache_hit(endpoint, url)
+                        if self.prefetcher is not None:
+                            self.prefetcher._hit(url)
+                        return entry.data
+                    return await self._revalidate(url, priority, entry)
+            return await self._coalesce(url, priority, entry)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if hooks is not None:
+                hooks.on_request_end(endpoint, url, time.perf_counter() - start, error)
+
+    async def _revalidate(self, url, priority, entry):
+        """Refresh an expired cache entry, returning it stale instead if the cache's policy allows."""
+        cache = self.cache
+        if self._lib == 'asyncio' and time.time() - entry.expires < cache.stale_while_revalidate:
+            cache.stale_hits += 1
+            if url not in self._refreshing:
+                task = self._refreshing[url] = self._async.spawn(self._refresh(url, entry))
+                task.add_done_callback(lambda _: self._refreshing.pop(url, None))
+            return entry.data
+        try:
+            return await self._coalesce(url, priority, entry)
+        except self._upstream_errors:
+            if time.time() - entry.expires >= cache.stale_if_error:
+                raise
+            cache.stale_errors += 1
+            return entry.data
+
+    async def _refresh(self, url, entry):
+        """Refresh an expired cache entry in the background."""
+        try:
+            await self._coalesce(url, PRIORITY_LOW, entry)
+        except Exception:
+            # the entry keeps being served stale, and the next request after the window retries in the foreground
+            pass
 
-    async def get_anime(self, target_id):
+    async def _coalesce(self, url, priority, entry=None):
+        """Share a single upstream request between concurrent callers of the same URL.
+
+        If the caller performing the request is cancelled, one of the waiting callers takes over.
+        """
+        while True:
+            flight = self._inflight.get(url)
+            if flight is None:
+                break
+            if self.prefetcher is not None:
+                self.prefetcher._hit(url)
+            await flight.event.wait()
+            if flight.done:
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+
+        flight = self._inflight[url] = _Flight(self._async.event())
+        try:
+            flight.result = await self._fetch(url, priority, entry)
+        except Exception as e:
+            flight.error = e
+            flight.done = True
+            raise
+        else:
+            flight.done = True
+            return flight.result
+        finally:
+            del self._inflight[url]
+            flight.event.set()
+
+    async def _send(self, url, priority, headers=None, stream=False):
+        """Send a GET request, retrying and tripping the circuit breaker according to the Client's policies.
+
+        Returns the response and its stripped body, which is empty if the API responded with 404 or 304.
+        With `stream`, the body is left unread and None is returned instead.
+        Raises :class:`RequestFailed` for other error statuses, once retries are exhausted.
+        """
+        retry = self.retry
+        breaker = self.circuit_breaker
+        hooks = self.hooks
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request()
+            if self.rate_limit is not None:
+                await self.rate_limit.acquire(priority)
+
+            try:
+                if hooks is not None:
+                    endpoint = self._endpoint(url)
+                    sent = time.perf_counter()
+                if stream and self._lib != 'asyncio':
+                    resp = await self.session.get(url, stream=True)
+                elif headers is None:
+                    resp = await self.session.get(url)
+                else:
+                    resp = await self.session.get(url, headers=headers)
+                status = self._status(resp)
+                if hooks is not None:
+                    received = time.perf_counter()
+                    hooks.on_response(endpoint, url, status, received - sent)
+                if (status < 400 or status == 404) and not stream:
+                    body = await self._read(resp)
+                    if hooks is not None:
+                        hooks.on_body_read(endpoint, url, len(body), time.perf_counter() - received)
+            except self._network_errors:
+                if breaker is not None:
+                    breaker.record_failure()
+                if retry is None or attempt + 1 >= retry.attempts:
+                    raise
+                delay = retry.delay(attempt)
+            else:
+                if status < 400 or status == 404:
+                    if breaker is not None:
+                        breaker.record_success()
+                    if stream:
+                        return resp, None
+                    return resp, body if status != 404 else b''
+
+                self._release(resp)
+                if breaker is not None:
+                    if status == 429 or status >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                if retry is None or status not in retry.statuses or attempt + 1 >= retry.attempts:
+                    raise RequestFailed("The API responded with status {}".format(status), status)
+                delay = retry.delay(attempt, parse_retry_after(self._header(resp, 'Retry-After')))
+
+            retry.retries += 1
+            attempt += 1
+            if hooks is not None:
+                hooks.on_retry(self._endpoint(url), url, attempt, delay)
+            await self._async.sleep(delay)
+
+    async def _fetch(self, url, priority, entry=None):
+        """Request a URL and cache its decoded payload.
+
+        If an expired cache `entry` is given, the request is made conditional on its validators,
+        and its payload is reused as-is if the API responds with `304 Not Modified`.
+        """
+        cache = self.cache
+        headers = entry.validators() if entry is not None else None
+        resp, body = await self._send(url, priority, headers)
+        etag = self._header(resp, 'ETag')
+        last_modified = self._header(resp, 'Last-Modified')
+
+        if headers is not None and self._status(resp) == 304:
+            cache.revalidations += 1
+            await cache.set(url, cache.make_entry(self._endpoint(url), entry.data, entry.size,
+                                                  etag or entry.etag, last_modified or entry.last_modified))
+            return entry.data
+
+        if not body:
+            return None
+        if self.hooks is None:
+            data = self._decode(resp, body)
+        else:
+            start = time.perf_counter()
+            data = self._decode(resp, body)
+            self.hooks.on_decode(self._endpoint(url), url, time.perf_counter() - start)
+
+        if cache is not None:
+            await cache.set(url, cache.make_entry(self._endpoint(url), data, len(body), etag, last_modified),
+                            body, self._encoding(resp))
+        if self.prefetcher is not None:
+            self.prefetcher._schedule(url, self._endpoint(url), data)
+        return data
+
+    def _build(self, cls, target_id, data):
+        """Build a model object from its payload, and register it."""
+        if self.lazy:
+            cls = lazy_class(cls)
+        hooks = self.hooks
+        if hooks is None:
+            return self._register(cls(target_id, data, state=self))
+        start = time.perf_counter()
+        result = cls(target_id, data, state=self)
+        hooks.on_build(cls._type, result, time.perf_counter() - start)
+        return self._register(result)
+
+    def _register(self, result):
+        """Track a retrieved entity in the identity map and search index."""
+        if self.identity_map is not None:
+            self.identity_map.upgrade(result)
+        if self.search_index is not None:
+            self.search_index.add_entity(result)
+        return result
+
+    async def get_anime(self, target_id, *, priority=PRIORITY_NORMAL):
         """Retrieves an :class:`Anime` object from an ID
 
         Raises a :class:`AnimeNotFound` Error if an Anime was not found corresponding to the ID.
         """
-        resp = await self.request(ANIME_URL + str(target_id))
+        resp = await self.request(self.base_url + 'anime/' + str(target_id), priority=priority)
         if resp is None:
             raise AnimeNotFound("Anime with the given ID was not found")
-        result = Anime(target_id, resp, state=self)
-        return result
+        return self._build(Anime, target_id, resp)
 
-    async def get_manga(self, target_id):
+    async def get_manga(self, target_id, *, priority=PRIORITY_NORMAL):
         """Retrieves a :class:`Manga` object from an ID
 
         Raises a :class:`MangaNotFound` Error if a Manga was not found corresponding to the ID.
         """
-        resp = await self.request(MANGA_URL + str(target_id))
+        resp = await self.request(self.base_url + 'manga/' + str(target_id), priority=priority)
         if resp is None:
             raise MangaNotFound("Manga with the given ID was not found")
-        result = Manga(target_id, resp, state=self)
-        return result
+        return self._build(Manga, target_id, resp)
 
-    async def get_character(self, target_id):
+    async def get_character(self, target_id, *, priority=PRIORITY_NORMAL):
         """Retrieves a :class:`Character` object from an ID
 
         Raises a :class:`CharacterNotFound` Error if a Character was not found corresponding to the ID.
         """
-        resp = await self.request(CHARACTER_URL + str(target_id))
+        resp = await self.request(self.base_url + 'character/' + str(target_id), priority=priority)
         if resp is None:
             raise CharacterNotFound("Character with the given ID was not found")
-        result = Character(target_id, resp, state=self)
-        return result
+        return self._build(Character, target_id, resp)
 
-    async def get_person(self, target_id):
+    async def get_person(self, target_id, *, priority=PRIORITY_NORMAL):
         """Retrieves a :class:`Person` object from an ID
 
         Raises a :class:`PersonNotFound` Error if a Person was not found corresponding to the ID.
         """
-        resp = await self.request(PERSON_URL + str(target_id))
+        resp = await self.request(self.base_url + 'person/' + str(target_id), priority=priority)
         if resp is None:
             raise PersonNotFound("Person with the given ID was not found")
-        result = Person(target_id, resp, state=self)
-        return result
+        return self._build(Person, target_id, resp)
+
+    async def get_anime_many(self, target_ids, *, concurrency=8, priority=PRIORITY_NORMAL):
+        """Retrieves many :class:`Anime` objects from a list of IDs
+
+        Returns a list in the same order as `target_ids`. Entries which could not be retrieved
+        hold the raised Error (for example :class:`AnimeNotFound`) instead of failing the whole batch.
+        """
+        return await self._get_many(self.get_anime, target_ids, concurrency, priority)
+
+    async def iter_anime_many(self, target_ids, *, concurrency=8, priority=PRIORITY_NORMAL):
+        """Retrieves many :class:`Anime` objects, yielding `(id, result)` tuples as they complete.
+
+        `result` is either the :class:`Anime` or the Error raised while retrieving it.
+        """
+        async for target_id, result in self._iter_many(self.get_anime, target_ids, concurrency, priority):
+            yield target_id, result
+
+    async def get_manga_many(self, target_ids, *, concurrency=8, priority=PRIORITY_NORMAL):
+        """Retrieves many :class:`Manga` objects from a list of IDs
+
+        Returns a list in the same order as `target_ids`. Entries which could not be retrieved
+        hold the raised Error (for example :class:`MangaNotFound`) instead of failing the whole batch.
+        """
+        return await self._get_many(self.get_manga, target_ids, concurrency, priority)
+
+    async def iter_manga_many(self, target_ids, *, concurrency=8, priority=PRIORITY_NORMAL):
+        """Retrieves many :class:`Manga` objects, yielding `(id, result)` tuples as they complete.
+
+        `result` is either the :class:`Manga` or the Error raised while retrieving it.
+        """
+        async for target_id, result in self._iter_many(self.get_manga, target_ids, concurrency, priority):
+            yield target_id, result
+
+    async def get_character_many(self, target_ids, *, concurrency=8, priority=PRIORITY_NORMAL):
+        """Retrieves many :class:`Character` objects from a list of IDs
+
+        Returns a list in the same order as `target_ids`. Entries which could not be retrieved
+        hold the raised Error (for example :class:`CharacterNotFound`) instead of failing the whole batch.
+        """
+        return await self._get_many(self.get_character, target_ids, concurrency, priority)
+
+    async def iter_character_many(self, target_ids, *, concurrency=8, priority=PRIORITY_NORMAL):
+        """Retrieves many :class:`Character` objects, yielding `(id, result)` tuples as they complete.
+
+        `result` is either the :class:`Character` or the Error raised while retrieving it.
+        """
+        async for target_id, result in self._iter_many(self.get_character, target_ids, concurrency, priority):
+            yield target_id, result
+
+    async def get_person_many(self, target_ids, *, concurrency=8, priority=PRIORITY_NORMAL):
+        """Retrieves many :class:`Person` objects from a list of IDs
+
+        Returns a list in the same order as `target_ids`. Entries which could not be retrieved
+        hold the raised Error (for example :class:`PersonNotFound`) instead of failing the whole batch.
+        """
+        return await self._get_many(self.get_person, target_ids, concurrency, priority)
+
+    async def iter_person_many(self, target_ids, *, concurrency=8, priority=PRIORITY_NORMAL):
+        """Retrieves many :class:`Person` objects, yielding `(id, result)` tuples as they complete.
+
+        `result` is either the :class:`Person` or the Error raised while retrieving it.
+        """
+        async for target_id, result in self._iter_many(self.get_person, target_ids, concurrency, priority):
+            yield target_id, result
+
+    def _map_many(self, getter, target_ids, concurrency, priority):
+        async def get(target_id):
+            return await getter(target_id, priority=priority)
 
-    async def search_anime(self, query):
+        return self._async.map_unordered(get, target_ids, concurrency)
+
+    async def _iter_many(self, getter, target_ids, concurrency, priority):
+        target_ids = list(target_ids)
+        async for index, result in self._map_many(getter, target_ids, concurrency, priority):
+            yield target_ids[index], result
+
+    async def _get_many(self, getter, target_ids, concurrency, priority):
+        target_ids = list(target_ids)
+        results = [None] * len(target_ids)
+        async for index, result in self._map_many(getter, target_ids, concurrency, priority):
+            results[index] = result
+        return results
+
+    async def _stream(self, url, key, priority):
+        """Yield the items of the `key` array of a response while it downloads, bypassing the cache.
+
+        The response is requested like any other, with the rate limiter, circuit breaker and
+        retry policy, but a download failing once items were yielded is not retried.
+        """
+        resp, _ = await self._send(url, priority, stream=True)
+        if self._lib == 'asyncio':
+            try:
+                async for item in iter_json_array(resp.content.iter_chunked(STREAM_CHUNK_SIZE), key,
+                                                  resp.charset or 'utf-8'):
+                    yield item
+            finally:
+                resp.release()
+        else:
+            async for item in iter_json_array(resp.body, key, resp.encoding or 'utf-8'):
+                yield item
+
+    async def _iter_person_section(self, target_id, key, build, priority):
+        try:
+            async for item in self._stream(self.base_url + 'person/' + str(target_id), key, priority):
+                yield build(item, self)
+        except ArrayNotFound:
+            raise PersonNotFound("Person with the given ID was not found")
+
+    def iter_voice_acting(self, target_id, *, priority=PRIORITY_NORMAL):
+        """Stream the voice acting roles of a Person as :class:`PartialCharacter` objects.
+
+        Unlike :attr:`Person.voice_acting`, characters are yielded while the response downloads,
+        which is much lighter on memory for prolific voice actors.
+
+        Raises a :class:`PersonNotFound` Error if a Person was not found corresponding to the ID.
+        Raises a `ValueError` if the response is malformed or cut short.
+        """
+        return self._iter_person_section(target_id, 'voice_acting_role', voice_acting_role, priority)
+
+    def iter_staff_positions(self, target_id, *, priority=PRIORITY_NORMAL):
+        """Stream the anime staff positions of a Person as :class:`PartialAnime` objects.
+
+        Raises a :class:`PersonNotFound` Error if a Person was not found corresponding to the ID.
+        Raises a `ValueError` if the response is malformed or cut short.
+        """
+        return self._iter_person_section(target_id, 'anime_staff_position', anime_position, priority)
+
+    def iter_published_manga(self, target_id, *, priority=PRIORITY_NORMAL):
+        """Stream the published manga of a Person as :class:`PartialManga` objects.
+
+        Raises a :class:`PersonNotFound` Error if a Person was not found corresponding to the ID.
+        Raises a `ValueError` if the response is malformed or cut short.
+        """
+        return self._iter_person_section(target_id, 'published_manga', manga_position, priority)
+
+    def _search_locally(self, cls, query):
+        if self.search_index is None:
+            return None
+        results = self.search_index.search(cls._type, query)
+        if not results:
+            return None
+        return [cls.interned(title, id, url, state=self) for id, title, url, _ in results]
+
+    def _search_url(self, type_, query):
+        return self.base_url + "search/{}/{}".format(type_, quote(query, safe=''))
+
+    async def search_anime(self, query, *, priority=PRIORITY_NORMAL):
         """Search for :class:`PartialAnime` by query.
 
-        Returns a list of results.
+        Returns a list of results. With a :class:`SearchIndex`, good local matches are returned without a request.
         """
-        resp = await self.request(SEARCH_URL + "anime/" + query)
+        results = self._search_locally(PartialAnime, query)
+        if results is not None:
+            return results
+        resp = await self.request(self._search_url("anime", query), priority=priority)
         if resp is None or not resp['result']:
             raise AnimeNotFound("Anime `{}` could not be found".format(query))
-        return [PartialAnime(a['title'], a['mal_id'], a['url'], state=self) for a in resp['result']]
+        return [PartialAnime.interned(a['title'], a['mal_id'], a['url'], state=self) for a in resp['result']]
 
-    async def search_manga(self, query):
+    async def search_manga(self, query, *, priority=PRIORITY_NORMAL):
         """Search for :class:`PartialManga` by query.
 
-        Returns a list of results.
+        Returns a list of results. With a :class:`SearchIndex`, good local matches are returned without a request.
         """
-        resp = await self.request(SEARCH_URL + "manga/" + query)
+        results = self._search_locally(PartialManga, query)
+        if results is not None:
+            return results
+        resp = await self.request(self._search_url("manga", query), priority=priority)
         if resp is None or not resp['result']:
             raise MangaNotFound("Manga `{}` could not be found".format(query))
-        return [PartialManga(m['title'], m['mal_id'], m['url'], state=self) for m in resp['result']]
+        return [PartialManga.interned(m['title'], m['mal_id'], m['url'], state=self) for m in resp['result']]
 
-    async def search_character(self, query):
+    async def search_character(self, query, *, priority=PRIORITY_NORMAL):
         """Search for :class:`PartialCharacter` by query.
 
-        Returns a list of results.
+        Returns a list of results. With a :class:`SearchIndex`, good local matches are returned without a request.
         """
-        resp = await self.request(SEARCH_URL + "character/" + query)
+        results = self._search_locally(PartialCharacter, query)
+        if results is not None:
+            return results
+        resp = await self.request(self._search_url("character", query), priority=priority)
         if resp is None or not resp['result']:
             raise CharacterNotFound("Character `{}` could not be found".format(query))
         return [PartialCharacter.from_search(c, state=self) for c in resp['result']]
 
-    async def search_person(self, query):
+    async def search_person(self, query, *, priority=PRIORITY_NORMAL):
         """Search for :class:`PartialPerson` by query.
 
-        Returns a list of results.
+        Returns a list of results. With a :class:`SearchIndex`, good local matches are returned without a request.
         """
-        resp = await self.request(SEARCH_URL + "person/" + query)
+        results = self._search_locally(PartialPerson, query)
+        if results is not None:
+            return results
+        resp = await self.request(self._search_url("person", query), priority=priority)
         if resp is None or not resp['result']:
             raise PersonNotFound("Person `{}` could not be found".format(query))
-        return [PartialPerson(p['name'], p['mal_id'], p['url'], state=self) for p in resp['result']]
+        return [PartialPerson.interned(p['name'], p['mal_id'], p['url'], state=self) for p in resp['result']]
 
     async def search_id(self, type_, query):
         """Parse a google query and return the ID.
 
+        Resolved IDs are remembered per type and normalized query, including queries without a result.
+
         Raises a :class:`TokageNotFound` Error if an ID was not found.
         """
+        key = (type_, ' '.join(query.casefold().split()))
+        try:
+            id = self._search_ids[key]
+        except KeyError:
+            id = self._search_ids[key] = await self._google_id(type_, query)
+            if len(self._search_ids) > SEARCH_ID_CACHE_SIZE:
+                self._search_ids.popitem(last=False)
+        else:
+            self._search_ids.move_to_end(key)
+
+        if id is None:
+            raise TokageNotFound("An ID corresponding to the given query was not found")
+        return id
+
+    async def _google_id(self, type_, query):
+        """Get the ID of the first MAL result of a google search, or None.
+
+        The results page is parsed while it downloads, and the download stops at the first result.
+        """
         query = "site:myanimelist.net/{}/ {}".format(type_, query)
         params = {
             'q': query,
@@ -220,22 +837,12 @@ class Client:
             if resp.status != 200:
                 raise RuntimeError('Google somehow failed to respond.')
 
-            root = etree.fromstring(await resp.text(), etree.HTMLParser())
-            nodes = root.findall(".//div[@class='g']")
-            for node in nodes:
-                url_node = node.find('.//h3/a')
-                if url_node is None:
-                    continue
-
-                url = url_node.attrib['href']
-                if not url.startswith('/url?'):
-                    continue
-
-                url = parse_qs(url[5:])['q'][0]
-                id = parse_id(url)
-                if id is None:
-                    raise TokageNotFound("An ID corresponding to the given query was not found")
-                return id
-
-            else:
-                raise TokageNotFound("An ID corresponding to the given query was not found")
+            parser = etree.HTMLPullParser(events=('end',), tag='a', encoding=resp.charset)
+            async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+                for _, node in parser.read_events():
+                    url = _result_url(node)
+                    if url is not None:
+                        url = parse_qs(url[5:]).get('q', [''])[0]
+                        return parse_id(url)
+            return None
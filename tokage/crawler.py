@@ -0,0 +1,232 @@
+"""Crawler of the graph of related entities"""
+
+import json
+import os
+
+from tokage.errors import TokageException
+from tokage.partial import BasePartial
+from tokage.ratelimit import PRIORITY_NORMAL
+
+__all__ = ('Crawler',)
+
+TYPES = ('anime', 'manga', 'person', 'character')
+
+# the attributes linking each type to others
+EDGES = {
+    'anime': ('related',),
+    'manga': ('related', 'author'),
+    'person': ('anime', 'manga', 'voice_acting'),
+    'character': ('animeography', 'mangaography', 'voice_actors'),
+}
+
+CHECKPOINT_VERSION = 1
+
+
+def _neighbours(type_, entity):
+    """Get the `(type, id)` pairs of the partials an entity links to."""
+    for name in EDGES[type_]:
+        value = getattr(entity, name)
+        if value is None:
+            continue
+        for partial in value if isinstance(value, list) else (value,):
+            yield partial._type, partial.id
+            # voice acting roles also link to the anime the character appears in
+            anime = getattr(partial, 'anime', None)
+            if isinstance(anime, BasePartial):
+                yield anime._type, anime.id
+
+
+def _key(node):
+    """Get the `(type, id)` pair of a seed, which is either such a pair or an entity."""
+    if isinstance(node, tuple):
+        type_, id = node
+    else:
+        type_ = node._type
+        id = node.id
+    if type_ not in TYPES:
+        raise ValueError("Cannot crawl from `{}` objects".format(type_))
+    return type_, int(id)
+
+
+class Crawler:
+    """Crawls outward from seed entities through the partials they link to, breadth first.
+
+    Anime and Manga are followed through `related` (and Manga through `author`), Persons
+    through `anime`, `manga` and `voice_acting`, and Characters through `animeography`,
+    `mangaography` and `voice_actors`. Every entity is retrieved at most once.
+
+    Iterate over the crawler with `async for` to get the retrieved entities as they are
+    resolved. Entities which could not be retrieved are recorded in :attr:`failed`.
+
+    With a `checkpoint` path, the state of the crawl is saved there every
+    `checkpoint_every` resolved entities and when the crawl ends. If the file already
+    exists when iterating, the crawl resumes from it and `seeds` are ignored; entities
+    resolved since the last checkpoint are retrieved (and yielded) again.
+
+    Parameters
+    ----------
+    client : :class:`Client`
+        The Client retrieving the entities.
+
+    seeds : Iterable[Union[tuple, :class:`Anime`, :class:`PartialAnime`, ...]]
+        The entities to start from, as `(type, id)` tuples (type being `anime`, `manga`,
+        `person` or `character`), full objects or partials.
+
+    max_depth : Optional[int]
+        Amount of links followed from the seeds. Defaults to 1; 0 only retrieves the seeds.
+
+    types : Optional[Iterable[str]]
+        The types of entities retrieved and followed. Defaults to every type.
+
+    concurrency : Optional[int]
+        Maximum amount of entities retrieved at once. Defaults to 8.
+
+    max_frontier : Optional[int]
+        Maximum amount of entities queued for the next depth. Entities discovered beyond
+        it are skipped and counted in :attr:`dropped`. Defaults to unbounded.
+
+    checkpoint : Optional[str]
+        Path of the JSON checkpoint file. Defaults to no checkpoints.
+
+    checkpoint_every : Optional[int]
+        Amount of resolved entities between checkpoints. Defaults to 100.
+
+    priority : Optional[int]
+        The :class:`RateLimiter` lane of the crawl's requests. Defaults to `PRIORITY_NORMAL`.
+
+    Attributes
+    ----------
+    visited : dict
+        Mapping of type to the set of IDs queued or retrieved so far.
+
+    failed : dict
+        Mapping of `(type, id)` to the Error raised while retrieving it. Errors restored
+        from a checkpoint are :class:`TokageException` with the original message.
+
+    resolved : int
+        Amount of entities retrieved so far.
+
+    dropped : int
+        Amount of entities skipped because the frontier was full.
+
+    """
+    def __init__(self, client, seeds, *, max_depth=1, types=TYPES, concurrency=8, max_frontier=None,
+                 checkpoint=None, checkpoint_every=100, priority=PRIORITY_NORMAL):
+        types = frozenset(types)
+        unknown = types.difference(TYPES)
+        if unknown:
+            raise ValueError("Unknown entity types: {}".format(', '.join(sorted(unknown))))
+        self.client = client
+        self.max_depth = max_depth
+        self.types = types
+        self.concurrency = concurrency
+        self.max_frontier = max_frontier
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.priority = priority
+        self.visited = {type_: set() for type_ in TYPES}
+        self.failed = {}
+        self.resolved = 0
+        self.dropped = 0
+        self._depth = 0
+        self._frontier = []
+        self._next = []
+        self._pending = None
+        for key in map(_key, seeds):
+            self._discover(key, self._frontier)
+
+    def __aiter__(self):
+        return self.crawl()
+
+    def _discover(self, key, frontier):
+        type_, id = key
+        if type_ not in self.types or id in self.visited[type_]:
+            return
+        if self.max_frontier is not None and len(frontier) >= self.max_frontier:
+            self.dropped += 1
+            return
+        self.visited[type_].add(id)
+        frontier.append(key)
+
+    async def _retrieve(self, key):
+        type_, id = key
+        return await getattr(self.client, 'get_' + type_)(id, priority=self.priority)
+
+    async def crawl(self):
+        """Crawl, yielding the retrieved entities as they are resolved."""
+        if self.checkpoint is not None and os.path.exists(self.checkpoint):
+            self.load()
+        since_checkpoint = 0
+        try:
+            while self._frontier:
+                frontier = self._frontier
+                pending = set(range(len(frontier)))
+                self._pending = (frontier, pending)
+                expand = self._depth < self.max_depth
+                async for index, result in self.client._async.map_unordered(
+                        self._retrieve, frontier, self.concurrency):
+                    pending.discard(index)
+                    if isinstance(result, Exception):
+                        self.failed[frontier[index]] = result
+                        continue
+
+                    self.resolved += 1
+                    if expand:
+                        for key in _neighbours(frontier[index][0], result):
+                            self._discover(key, self._next)
+                    since_checkpoint += 1
+                    if self.checkpoint is not None and since_checkpoint >= self.checkpoint_every:
+                        self.save()
+                        since_checkpoint = 0
+                    yield result
+
+                self._depth += 1
+                self._frontier, self._next = self._next, []
+                self._pending = None
+        finally:
+            if self.checkpoint is not None:
+                self.save()
+
+    def state(self):
+        """Get the state of the crawl as a JSON serializable dict."""
+        pending = self._pending
+        if pending is None:
+            frontier = self._frontier
+        else:
+            frontier = [pending[0][index] for index in sorted(pending[1])]
+        return {
+            'version': CHECKPOINT_VERSION,
+            'depth': self._depth,
+            'frontier': [list(key) for key in frontier],
+            'next': [list(key) for key in self._next],
+            'visited': {type_: sorted(ids) for type_, ids in self.visited.items()},
+            'failed': [[type_, id, str(error)] for (type_, id), error in self.failed.items()],
+            'resolved': self.resolved,
+            'dropped': self.dropped,
+        }
+
+    def save(self, path=None):
+        """Write the state of the crawl to `path`, defaulting to the checkpoint path.
+
+        The file is replaced atomically, so a crash while saving keeps the previous checkpoint.
+        """
+        path = path or self.checkpoint
+        temp = path + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(self.state(), f, separators=(',', ':'))
+        os.replace(temp, path)
+
+    def load(self, path=None):
+        """Restore the state of the crawl from `path`, defaulting to the checkpoint path."""
+        with open(path or self.checkpoint, encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') != CHECKPOINT_VERSION:
+            raise ValueError("Unsupported checkpoint version: {}".format(state.get('version')))
+        self._depth = state['depth']
+        self._frontier = [tuple(key) for key in state['frontier']]
+        self._next = [tuple(key) for key in state['next']]
+        self._pending = None
+        self.visited = {type_: set(state['visited'].get(type_, ())) for type_ in TYPES}
+        self.failed = {(type_, id): TokageException(message) for type_, id, message in state['failed']}
+        self.resolved = state['resolved']
+        self.dropped = state['dropped']
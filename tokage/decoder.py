@@ -0,0 +1,138 @@
+"""JSON decoder backends for the Client"""
+
+import codecs
+import json
+
+from tokage.utils import may_have_entities, unescape_in_place
+
+__all__ = ('Decoder', 'StdlibDecoder', 'OrjsonDecoder', 'UjsonDecoder', 'SimdjsonDecoder', 'get_decoder')
+
+_utf8_names = {}
+
+
+def _is_utf8(encoding):
+    try:
+        return _utf8_names[encoding]
+    except KeyError:
+        result = _utf8_names[encoding] = codecs.lookup(encoding).name == 'utf-8'
+        return result
+
+
+class Decoder:
+    """Interface of the JSON decoders used by :class:`Client`.
+
+    Backends implement :meth:`loads`. Documents a backend rejects (for example
+    `NaN` or integers beyond 64 bits) are decoded with the standard library
+    instead, so every backend gives the same output.
+    """
+    name = None
+    # the errors of the backend for documents it cannot decode
+    _errors = (ValueError,)
+
+    def _loads(self, data):
+        raise NotImplementedError
+
+    def loads(self, data):
+        """Decode a JSON document from UTF-8 `bytes` or a `str`, without unescaping it."""
+        try:
+            return self._loads(data)
+        except self._errors:
+            return json.loads(data)
+
+    def decode(self, body, encoding='utf-8'):
+        """Decode a response body in the given encoding, unescaping the HTML entities in its strings."""
+        if not _is_utf8(encoding):
+            body = body.decode(encoding)
+        if not may_have_entities(body):
+            return self.loads(body)
+        return unescape_in_place(self.loads(body))
+
+
+class StdlibDecoder(Decoder):
+    """The :mod:`json` module of the standard library."""
+    name = 'json'
+
+    def _loads(self, data):
+        return json.loads(data)
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+# maps digits to `0` and every other byte to a space, so that runs of digits can be found with a substring search
+_DIGITS = bytes(0x30 if 0x30 <= byte <= 0x39 else 0x20 for byte in range(256))
+# the shortest run of digits which may be an integer beyond 64 bits
+_LONG_DIGITS = b'0' * 19
+
+
+class OrjsonDecoder(Decoder):
+    """The `orjson` module."""
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson_loads = orjson.loads
+
+    def _loads(self, data):
+        # orjson turns integers beyond 64 bits into floats instead of rejecting them
+        if type(data) is str:
+            data = data.encode('utf-8')
+        if _LONG_DIGITS in data.translate(_DIGITS):
+            return json.loads(data)
+        return self._orjson_loads(data)
+
+
+class UjsonDecoder(Decoder):
+    """The `ujson` module."""
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._loads = ujson.loads
+
+
+class SimdjsonDecoder(Decoder):
+    """The `pysimdjson` module. Its parser is reused, so a decoder must not be shared between threads."""
+    name = 'simdjson'
+    _errors = (ValueError, RuntimeError)
+
+    def __init__(self):
+        import simdjson
+        self._parser = simdjson.Parser()
+
+    def _loads(self, data):
+        if type(data) is str:
+            data = data.encode('utf-8')
+        return self._parser.parse(data, True)
+
+
+# in order of preference
+BACKENDS = {
+    'orjson': OrjsonDecoder,
+    'simdjson': SimdjsonDecoder,
+    'ujson': UjsonDecoder,
+    'json': StdlibDecoder,
+}
+
+
+def get_decoder(name=None):
+    """Get a :class:`Decoder` by backend name (`orjson`, `simdjson`, `ujson` or `json`).
+
+    Without a name, the fastest installed backend is used.
+    Raises an `ImportError` if the named backend is not installed.
+    """
+    if name is not None:
+        try:
+            backend = BACKENDS[name]
+        except KeyError:
+            raise ValueError("Unknown JSON decoder `{}`, valid decoders: {}".format(name, ', '.join(BACKENDS)))
+        try:
+            return backend()
+        except ImportError:
+            raise ImportError("The `{}` JSON decoder requires the `{}` module.".format(name, name))
+
+    for backend in BACKENDS.values():
+        try:
+            return backend()
+        except ImportError:
+            continue
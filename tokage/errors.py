@@ -1,5 +1,10 @@
-class TokageNotFound(Exception):
-    """This Error is the base class of all Errors in Tokage.
+class TokageException(Exception):
+    """This Error is the base class of all Errors in Tokage."""
+    pass
+
+
+class TokageNotFound(TokageException):
+    """This Error is the base class of the Errors raised when something was not found.
     Usually you wont recive this error, but some functions may raise it.
     """
     pass
@@ -23,3 +28,22 @@ class PersonNotFound(TokageNotFound):
 class CharacterNotFound(TokageNotFound):
     """This Error is raised when a Character was not found."""
     pass
+
+
+class RequestFailed(TokageException):
+    """This Error is raised when the API responded with an error status, even after retrying.
+
+    Attributes
+    ----------
+    status : int
+        The HTTP status of the last response.
+
+    """
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class CircuitOpen(RequestFailed):
+    """This Error is raised instead of sending a request while the :class:`CircuitBreaker` is open."""
+    pass
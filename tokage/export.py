@@ -0,0 +1,236 @@
+"""Columnar export of retrieved objects"""
+
+import importlib
+import itertools
+import operator
+
+from tokage.anime import Anime
+from tokage.manga import Manga
+
+__all__ = ('Exporter',)
+
+MISSING_INT = -1
+
+# column name -> kind, in export order
+FIELDS = {
+    Anime: (
+        ('id', 'int'), ('title', 'str'), ('type', 'str'), ('status', 'str'), ('episodes', 'int'),
+        ('airing', 'bool'), ('score', 'float'), ('rank', 'int'), ('popularity', 'int'),
+        ('members', 'int'), ('favorites', 'int'), ('genres', 'genres'),
+    ),
+    Manga: (
+        ('id', 'int'), ('title', 'str'), ('type', 'str'), ('status', 'str'), ('volumes', 'int'),
+        ('chapters', 'int'), ('publishing', 'bool'), ('score', 'float'), ('rank', 'int'),
+        ('popularity', 'int'), ('members', 'int'), ('favorites', 'int'), ('genres', 'genres'),
+    ),
+}
+
+
+def _import(name, extra=''):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImportError("Exporting to {} requires the `{}` module.".format(extra or name, name.split('.')[0]))
+
+
+def _score(value):
+    # the score may be a (score, voters) pair
+    if isinstance(value, (list, tuple)):
+        return value[0] if value else None
+    return value
+
+
+class _ParquetSink:
+    """An open Parquet file written to chunk by chunk, see :meth:`Exporter.parquet_writer`."""
+    def __init__(self, exporter, path, **kwargs):
+        parquet = _import('pyarrow.parquet', 'Parquet')
+        self._exporter = exporter
+        self._writer = parquet.ParquetWriter(path, exporter.arrow_schema(), **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, models):
+        """Write the models of an iterable, one row group per chunk."""
+        for batch in self._exporter.iter_arrow(models):
+            self._writer.write_batch(batch)
+
+    def close(self):
+        self._writer.close()
+
+
+class Exporter:
+    """Converts collections of :class:`Anime` or :class:`Manga` objects to columnar form.
+
+    Scalar attributes become typed columns, and `genres` is dictionary-encoded: every
+    row holds the codes of its genres in :attr:`genres`. Codes are stable for the
+    lifetime of the exporter, so the chunks of a stream can be concatenated.
+
+    Models are converted `chunk_size` at a time by the `iter_*` methods and
+    :meth:`write_parquet`, so only one chunk of columns is in memory at once.
+
+    NumPy export requires `numpy`, and Arrow and Parquet export require `pyarrow`.
+
+    Parameters
+    ----------
+    cls : type
+        The exported class, :class:`Anime` or :class:`Manga`.
+
+    fields : Optional[Sequence[str]]
+        The exported attributes, in column order. Defaults to every supported attribute:
+        `id`, `title`, `type`, `status`, `episodes` (Anime) or `volumes` and `chapters`
+        (Manga), `airing` (Anime) or `publishing` (Manga), `score`, `rank`, `popularity`,
+        `members`, `favorites` and `genres`.
+
+    chunk_size : Optional[int]
+        Amount of models per chunk. Defaults to 1024.
+
+    Attributes
+    ----------
+    genres : list[str]
+        The genre names, indexed by their code.
+
+    """
+    def __init__(self, cls, *, fields=None, chunk_size=1024):
+        if cls not in FIELDS:
+            raise ValueError("Only Anime and Manga objects can be exported, not `{}`".format(cls.__name__))
+        kinds = dict(FIELDS[cls])
+        fields = tuple(fields or (name for name, _ in FIELDS[cls]))
+        for name in fields:
+            if name not in kinds:
+                raise ValueError("`{}` is not an exportable {} attribute".format(name, cls.__name__))
+        self.cls = cls
+        self.fields = tuple((name, kinds[name]) for name in fields)
+        self.chunk_size = chunk_size
+        self.genres = []
+        self._genre_codes = {}
+
+    def _chunks(self, models):
+        models = iter(models)
+        while True:
+            chunk = list(itertools.islice(models, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _encode_genres(self, raw_genres):
+        """Dictionary-encode the raw genres of a chunk, returning the list offsets and the flat codes."""
+        codes = self._genre_codes
+        get_code = codes.get
+        offsets = [0]
+        flat = []
+        append = flat.append
+        for raw in raw_genres:
+            if raw:
+                for genre in raw:
+                    name = genre['name']
+                    code = get_code(name)
+                    if code is None:
+                        code = codes[name] = len(self.genres)
+                        self.genres.append(name)
+                    append(code)
+            offsets.append(len(flat))
+        return offsets, flat
+
+    def _columns(self, models):
+        """Get the raw values of a chunk, as a list of `(name, kind, values)`."""
+        # read the raw genres, so that exporting does not cache a list on every model
+        names = [name if kind != 'genres' else '_raw_genres' for name, kind in self.fields]
+        getter = operator.attrgetter(*names)
+        if len(names) == 1:
+            values = [[getter(model) for model in models]]
+        else:
+            rows = [getter(model) for model in models]
+            values = [list(column) for column in zip(*rows)] if rows else [[] for _ in names]
+        columns = []
+        for (name, kind), column in zip(self.fields, values):
+            if name == 'score':
+                column = [_score(value) for value in column]
+            columns.append((name, kind, column))
+        return columns
+
+    def numpy_dtype(self):
+        """Get the NumPy structured dtype of exported chunks."""
+        numpy = _import('numpy', 'NumPy')
+        types = {'int': numpy.int64, 'float': numpy.float64, 'bool': numpy.bool_,
+                 'str': object, 'genres': object}
+        return numpy.dtype([(name, types[kind]) for name, kind in self.fields])
+
+    def to_numpy(self, models):
+        """Convert models to a NumPy structured array.
+
+        Missing integers are :data:`MISSING_INT` (-1), missing floats NaN and missing
+        booleans False. String columns hold Python objects, and each row's `genres`
+        is an `int16` array of genre codes.
+        """
+        numpy = _import('numpy', 'NumPy')
+        models = list(models)
+        array = numpy.empty(len(models), self.numpy_dtype())
+        for name, kind, column in self._columns(models):
+            if kind == 'int':
+                array[name] = [MISSING_INT if value is None else value for value in column]
+            elif kind == 'float':
+                array[name] = [numpy.nan if value is None else value for value in column]
+            elif kind == 'bool':
+                array[name] = [bool(value) for value in column]
+            elif kind == 'str':
+                array[name] = column
+            else:
+                offsets, codes = self._encode_genres(column)
+                codes = numpy.array(codes, numpy.int16)
+                field = array[name]
+                for i, start, end in zip(range(len(models)), offsets, offsets[1:]):
+                    field[i] = codes[start:end]
+        return array
+
+    def iter_numpy(self, models):
+        """Convert the models of an iterable to NumPy structured arrays, yielding one per chunk."""
+        for chunk in self._chunks(models):
+            yield self.to_numpy(chunk)
+
+    def arrow_schema(self):
+        """Get the Arrow schema of exported chunks."""
+        arrow = _import('pyarrow', 'Arrow')
+        types = {'int': arrow.int64(), 'float': arrow.float64(), 'bool': arrow.bool_(), 'str': arrow.string(),
+                 'genres': arrow.list_(arrow.dictionary(arrow.int16(), arrow.string()))}
+        return arrow.schema([(name, types[kind]) for name, kind in self.fields])
+
+    def _record_batch(self, models):
+        arrow = _import('pyarrow', 'Arrow')
+        schema = self.arrow_schema()
+        arrays = []
+        for name, kind, column in self._columns(models):
+            if kind != 'genres':
+                arrays.append(arrow.array(column, schema.field(name).type))
+                continue
+            offsets, codes = self._encode_genres(column)
+            values = arrow.DictionaryArray.from_arrays(arrow.array(codes, arrow.int16()),
+                                                       arrow.array(self.genres, arrow.string()))
+            arrays.append(arrow.ListArray.from_arrays(arrow.array(offsets, arrow.int32()), values))
+        return arrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def to_arrow(self, models):
+        """Convert models to an Arrow `Table`, with null for missing values."""
+        arrow = _import('pyarrow', 'Arrow')
+        return arrow.Table.from_batches(list(self.iter_arrow(models)), self.arrow_schema())
+
+    def iter_arrow(self, models):
+        """Convert the models of an iterable to Arrow `RecordBatch` objects, yielding one per chunk."""
+        for chunk in self._chunks(models):
+            yield self._record_batch(chunk)
+
+    def parquet_writer(self, path, **kwargs):
+        """Open a Parquet file to write models to chunk by chunk, for example as they are retrieved.
+
+        Returns an object with `write(models)` and `close()` methods, which can be used as a
+        context manager. Keyword arguments are passed to `pyarrow.parquet.ParquetWriter`.
+        """
+        return _ParquetSink(self, path, **kwargs)
+
+    def write_parquet(self, models, path, **kwargs):
+        """Write the models of an iterable to a Parquet file, one row group per chunk."""
+        with self.parquet_writer(path, **kwargs) as writer:
+            writer.write(models)
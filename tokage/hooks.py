@@ -0,0 +1,189 @@
+"""Request lifecycle hooks and metrics for the Client"""
+
+import bisect
+
+__all__ = ('Hooks', 'Histogram', 'Metrics')
+
+
+class Hooks:
+    """Callbacks around the phases of the requests made by a :class:`Client`.
+
+    Subclass it and override the callbacks you need; they are plain functions called
+    inline, so they should return quickly. `endpoint` is the first path segment of the
+    Jikan URL (`anime`, `manga`, `person`, `character` or `search`) and durations are
+    in seconds.
+
+    A request answered by the cache only goes through :meth:`on_request_start`,
+    :meth:`on_cache_hit` and :meth:`on_request_end`. Concurrent requests of a URL share
+    a single upstream request, whose phases are reported once.
+    """
+    def on_request_start(self, endpoint, url):
+        """Called when :meth:`Client.request` is called."""
+
+    def on_cache_hit(self, endpoint, url):
+        """Called when a request is answered with a fresh cached payload."""
+
+    def on_response(self, endpoint, url, status, elapsed):
+        """Called when the headers of an upstream response arrived, `elapsed` after the request was sent."""
+
+    def on_body_read(self, endpoint, url, size, elapsed):
+        """Called when the body of an upstream response was read, `size` bytes in `elapsed`."""
+
+    def on_retry(self, endpoint, url, attempt, delay):
+        """Called when a failed attempt is retried after `delay`."""
+
+    def on_decode(self, endpoint, url, elapsed):
+        """Called when a response body was decoded and unescaped, which took `elapsed`."""
+
+    def on_build(self, endpoint, model, elapsed):
+        """Called when a model object was built from a payload, which took `elapsed`."""
+
+    def on_request_end(self, endpoint, url, elapsed, error):
+        """Called when :meth:`Client.request` returns or raises `error`, `elapsed` after it was called."""
+
+
+class Histogram:
+    """A latency histogram with fixed, roughly logarithmic buckets.
+
+    Parameters
+    ----------
+    bounds : Optional[Sequence[float]]
+        Upper bounds of the buckets, in seconds, in increasing order. Values above the
+        last bound fall in an extra, unbounded bucket. Defaults to :attr:`BOUNDS`.
+
+    Attributes
+    ----------
+    counts : List[int]
+        Amount of values per bucket.
+
+    count : int
+        Amount of recorded values.
+
+    total : float
+        Sum of the recorded values.
+
+    max : float
+        Largest recorded value.
+
+    """
+    BOUNDS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    __slots__ = ('bounds', 'counts', 'count', 'total', 'max')
+
+    def __init__(self, bounds=None):
+        self.bounds = tuple(bounds or self.BOUNDS)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def __repr__(self):
+        return '<Histogram count={0.count} mean={0.mean:.4f} p50={1:.4f} p99={2:.4f}>'.format(
+            self, self.percentile(0.5), self.percentile(0.99))
+
+    def record(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction):
+        """Estimate a percentile (`fraction` between 0 and 1) as the upper bound of the bucket it falls in."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class _EndpointMetrics:
+    __slots__ = ('requests', 'errors', 'cache_hits', 'upstream', 'retries', 'bytes',
+                 'total', 'network', 'read', 'decode', 'build')
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.upstream = 0
+        self.retries = 0
+        self.bytes = 0
+        self.total = Histogram()
+        self.network = Histogram()
+        self.read = Histogram()
+        self.decode = Histogram()
+        self.build = Histogram()
+
+
+class Metrics(Hooks):
+    """Built-in :class:`Hooks` collecting counters and latency histograms per endpoint.
+
+    For every endpoint, :meth:`get` returns an object with the counters `requests`,
+    `errors`, `cache_hits`, `upstream` (upstream responses, retries included), `retries`
+    and `bytes` (bytes read), and the :class:`Histogram` attributes `total` (the whole
+    call to :meth:`Client.request`), `network` (until the response headers arrived),
+    `read` (reading the body), `decode` and `build` (building model objects).
+    """
+    def __init__(self):
+        self.endpoints = {}
+
+    def get(self, endpoint):
+        """Get the metrics of an endpoint."""
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = _EndpointMetrics()
+        return metrics
+
+    def clear(self):
+        self.endpoints.clear()
+
+    def summary(self):
+        """Get a text table of the metrics, with `mean/p99` latencies in milliseconds."""
+        lines = ['{:<10} {:>8} {:>6} {:>6} {:>7} {:>10} {:>15} {:>15} {:>15} {:>15} {:>15}'.format(
+            'endpoint', 'requests', 'errors', 'hits', 'retries', 'KiB', 'total ms', 'network ms',
+            'read ms', 'decode ms', 'build ms')]
+        for endpoint, m in sorted(self.endpoints.items()):
+            timings = ['{:>15}'.format('{:.2f}/{:.2f}'.format(h.mean * 1000, h.percentile(0.99) * 1000))
+                       for h in (m.total, m.network, m.read, m.decode, m.build)]
+            lines.append('{:<10} {:>8} {:>6} {:>6} {:>7} {:>10.1f} {}'.format(
+                endpoint, m.requests, m.errors, m.cache_hits, m.retries, m.bytes / 1024, ' '.join(timings)))
+        return '\n'.join(lines)
+
+    def on_request_start(self, endpoint, url):
+        self.get(endpoint).requests += 1
+
+    def on_cache_hit(self, endpoint, url):
+        self.get(endpoint).cache_hits += 1
+
+    def on_response(self, endpoint, url, status, elapsed):
+        metrics = self.get(endpoint)
+        metrics.upstream += 1
+        metrics.network.record(elapsed)
+
+    def on_body_read(self, endpoint, url, size, elapsed):
+        metrics = self.get(endpoint)
+        metrics.bytes += size
+        metrics.read.record(elapsed)
+
+    def on_retry(self, endpoint, url, attempt, delay):
+        self.get(endpoint).retries += 1
+
+    def on_decode(self, endpoint, url, elapsed):
+        self.get(endpoint).decode.record(elapsed)
+
+    def on_build(self, endpoint, model, elapsed):
+        self.get(endpoint).build.record(elapsed)
+
+    def on_request_end(self, endpoint, url, elapsed, error):
+        metrics = self.get(endpoint)
+        metrics.total.record(elapsed)
+        if error is not None:
+            metrics.errors += 1
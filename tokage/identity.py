@@ -0,0 +1,78 @@
+"""Identity map for partial objects"""
+
+import weakref
+
+from tokage.base import TokageBase, slot_names
+
+__all__ = ('IdentityMap',)
+
+
+class IdentityMap:
+    """Maps a type and ID to a single canonical partial object.
+
+    Partials are held weakly, so an entry disappears once nothing else references it.
+    Full objects are tracked weakly as well, so partials seen after their full object
+    was retrieved are upgraded immediately.
+
+    A canonical partial only holds the identity of its object (ID, title or name, URL).
+    Partials carrying attributes which depend on the response they were seen in
+    (`relation`, `language`, `anime`) are interned separately, by type, ID and those
+    attributes, and linked to the canonical partial: they share its upgrade to the full object.
+    """
+    def __init__(self):
+        self._partials = weakref.WeakValueDictionary()
+        self._contextual = weakref.WeakValueDictionary()
+        self._full = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._partials)
+
+    def get(self, type_, id):
+        """Get the canonical partial of a type (`anime`, `manga`, `person` or `character`) and ID, or None."""
+        return self._partials.get((type_, int(id)))
+
+    def intern(self, partial):
+        """Get the canonical partial equal to `partial`, registering it if there is none yet."""
+        key = (partial._type, partial.id)
+        contextual = any(getattr(partial, name) is not None for name in partial._context)
+        canonical = self._partials.get(key)
+        if canonical is None:
+            canonical = _identity_of(partial) if contextual else partial
+            self._partials[key] = canonical
+            canonical._full = self._full.get(key)
+        if not contextual:
+            return canonical
+        # the partial is specific to its response: attributes it lacks are read from the canonical partial
+        key += _context_key(partial)
+        interned = self._contextual.get(key)
+        if interned is None:
+            partial._full = canonical
+            interned = self._contextual[key] = partial
+        return interned
+
+    def upgrade(self, full):
+        """Register a full object, upgrading its canonical partial in place."""
+        key = (full._type, full.id)
+        self._full[key] = full
+        partial = self._partials.get(key)
+        if partial is not None:
+            partial._full = full
+
+
+def _context_key(partial):
+    key = []
+    for name in partial._context:
+        value = getattr(partial, name)
+        # partials in the context (the `anime` of a character) are keyed by their own identity
+        key.append((value._type, value.id) if isinstance(value, TokageBase) else value)
+    return tuple(key)
+
+
+def _identity_of(partial):
+    """Copy a partial without its response-specific attributes."""
+    cls = type(partial)
+    copy = cls.__new__(cls)
+    for name in slot_names(cls):
+        if name != '__weakref__':
+            setattr(copy, name, None if name in cls._context else getattr(partial, name))
+    return copy
@@ -0,0 +1,133 @@
+"""Local search index of seen entities"""
+
+import re
+import unicodedata
+from collections import Counter
+from itertools import chain
+
+__all__ = ('SearchIndex',)
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize(text):
+    """Casefold `text`, strip accents and punctuation, and collapse whitespace."""
+    text = unicodedata.normalize('NFKD', text.casefold())
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return _NON_WORD.sub(' ', text).strip()
+
+
+def trigrams(text):
+    """Get the trigrams of normalized `text`, padded so word starts weigh more and short words still match."""
+    grams = set()
+    for word in text.split():
+        padded = '  ' + word + ' '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class SearchIndex:
+    """A local, trigram based index of the titles and names of seen entities.
+
+    When a :class:`Client` keeps one, the titles, synonyms and Japanese titles of every
+    retrieved entity (and the titles of partials in its responses) are indexed, and
+    `search_*` calls are answered from the index when it has good enough matches,
+    without a round trip to the API.
+
+    Results are scored by the share of the query's trigrams found in their names, and
+    names starting with the query are ranked first, which suits autocompletion.
+
+    Parameters
+    ----------
+    min_score : Optional[float]
+        Minimum score, between 0 and 1, of a result. Defaults to 0.6.
+
+    limit : Optional[int]
+        Maximum amount of results per search. Defaults to 10.
+
+    """
+    def __init__(self, *, min_score=0.6, limit=10):
+        self.min_score = min_score
+        self.limit = limit
+        self._entries = {}
+        self._grams = {}
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    def __contains__(self, key):
+        type_, id = key
+        return int(id) in self._entries.get(type_, ())
+
+    def add(self, type_, id, title, url, names=()):
+        """Index an entity of a type (`anime`, `manga`, `person` or `character`).
+
+        `title` is the name results are shown with; it is searchable along with `names`.
+        Adding an indexed entity again indexes its new names.
+        """
+        id = int(id)
+        entries = self._entries.setdefault(type_, {})
+        grams = self._grams.setdefault(type_, {})
+        entry = entries.get(id)
+        if entry is None:
+            entry = entries[id] = [title, url, []]
+        known = entry[2]
+        for name in (title,) + tuple(names):
+            if not name:
+                continue
+            name = normalize(name)
+            if not name or name in known:
+                continue
+            known.append(name)
+            for gram in trigrams(name):
+                grams.setdefault(gram, set()).add(id)
+
+    def add_entity(self, entity):
+        """Index a retrieved :class:`Anime`, :class:`Manga`, :class:`Person` or :class:`Character`."""
+        names = list(getattr(entity, 'synonyms', None) or ())
+        names.append(getattr(entity, 'japanese_title', None) or getattr(entity, 'japanese_name', None))
+        title = entity.title if hasattr(entity, 'title') else entity.name
+        self.add(entity._type, entity.id, title, entity.link, names)
+
+    def discard(self, type_, id):
+        """Remove an entity from the index, if it is indexed."""
+        entry = self._entries.get(type_, {}).pop(int(id), None)
+        if entry is None:
+            return
+        grams = self._grams[type_]
+        for name in entry[2]:
+            for gram in trigrams(name):
+                ids = grams.get(gram)
+                if ids is not None:
+                    ids.discard(int(id))
+                    if not ids:
+                        del grams[gram]
+
+    def clear(self):
+        self._entries.clear()
+        self._grams.clear()
+
+    def search(self, type_, query, limit=None):
+        """Search for entities of a type, best matches first.
+
+        Returns a list of `(id, title, url, score)` tuples, empty if nothing scored at least `min_score`.
+        """
+        query = normalize(query)
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+        grams = self._grams.get(type_, {})
+        counts = Counter(chain.from_iterable(grams.get(gram, ()) for gram in query_grams))
+
+        entries = self._entries.get(type_, {})
+        results = []
+        threshold = self.min_score * len(query_grams)
+        for id, count in counts.items():
+            if count < threshold:
+                continue
+            title, url, names = entries[id]
+            prefix = any(name.startswith(query) for name in names)
+            results.append((prefix, count / len(query_grams), id, title, url))
+
+        results.sort(key=lambda result: (not result[0], -result[1], result[3]))
+        return [(id, title, url, score) for _, score, id, title, url in results[:limit or self.limit]]
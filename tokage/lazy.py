@@ -0,0 +1,161 @@
+"""Lazily hydrated payloads and models"""
+
+from collections.abc import Mapping
+from html import unescape
+
+from tokage.anime import Anime
+from tokage.base import TokageBase
+from tokage.character import Character
+from tokage.decoder import StdlibDecoder, _is_utf8
+from tokage.manga import Manga
+from tokage.person import Person
+from tokage.utils import may_have_entities, unescape_in_place
+
+__all__ = ('LazyPayload', 'LazyAnime', 'LazyManga', 'LazyPerson', 'LazyCharacter', 'lazy_class')
+
+_STDLIB = StdlibDecoder()
+
+
+class LazyPayload(Mapping):
+    """A read-only mapping over the raw body of a JSON object response.
+
+    The body is only decoded when a field is first read, and the decoded object then
+    replaces it. Only the keys are unescaped when decoding: fields are unescaped one by
+    one as they are read.
+
+    Parameters
+    ----------
+    body : bytes
+        The raw response body.
+
+    encoding : Optional[str]
+        The encoding of the body. Defaults to UTF-8.
+
+    decoder : Optional[:class:`Decoder`]
+        The JSON decoder of the body. Defaults to the standard library's.
+
+    """
+    __slots__ = ('_body', '_encoding', '_decoder', '_raw', '_escaped', '_values')
+
+    def __init__(self, body, encoding='utf-8', decoder=None):
+        self._body = body
+        self._encoding = encoding
+        self._decoder = decoder or _STDLIB
+        self._raw = None
+        self._escaped = True
+        self._values = {}
+
+    def __repr__(self):
+        state = 'decoded' if self._raw is not None else '{} bytes'.format(len(self._body))
+        return '<LazyPayload {}>'.format(state)
+
+    def _decoded(self, keep=True):
+        raw = self._raw
+        if raw is None:
+            body = self._body
+            if not _is_utf8(self._encoding):
+                body = body.decode(self._encoding)
+            self._escaped = may_have_entities(body)
+            raw = self._decoder.loads(body)
+            if self._escaped and any('&' in key for key in raw):
+                raw = {unescape(key) if '&' in key else key: value for key, value in raw.items()}
+            if keep:
+                self._raw = raw
+                self._body = None
+        return raw
+
+    def __getitem__(self, key):
+        values = self._values
+        try:
+            return values[key]
+        except KeyError:
+            pass
+        value = self._decoded()[key]
+        if self._escaped:
+            value = unescape_in_place(value)
+        values[key] = value
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self):
+        return iter(self._decoded())
+
+    def __len__(self):
+        return len(self._decoded())
+
+
+class _LazyField:
+    """Shadows a slot of a model class, loading its value from the payload on first access."""
+    __slots__ = ('slot', 'load')
+
+    def __init__(self, slot, load):
+        self.slot = slot
+        self.load = load
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        try:
+            return self.slot.__get__(obj, cls)
+        except AttributeError:
+            payload = obj._payload
+            if payload is None:
+                raise
+        value = self.load(payload)
+        self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+    def __delete__(self, obj):
+        self.slot.__delete__(obj)
+
+
+class _LazyModel(TokageBase):
+    """Base of the lazy model classes: only the ID is set when built, other attributes on first access."""
+    __slots__ = ()
+
+    def __init__(self, id, data, **kwargs):
+        self.id = int(id)
+        self._payload = data
+        TokageBase.__init__(self, state=kwargs.get("state"))
+
+    def __getstate__(self):
+        # reading every attribute hydrates the object, so the payload can be dropped
+        state = super().__getstate__()
+        state.pop('_payload', None)
+        return state
+
+    def __setstate__(self, state):
+        self._payload = None
+        super().__setstate__(state)
+
+
+def _make_lazy(cls):
+    namespace = {
+        '__slots__': ('_payload',),
+        '__module__': __name__,
+        '__doc__': "A lazily hydrated :class:`{0}`, see :class:`Client`'s `lazy` option.".format(cls.__name__),
+    }
+    for name, load in cls._fields.items():
+        namespace[name] = _LazyField(cls.__dict__[name], load)
+    return type('Lazy' + cls.__name__, (_LazyModel, cls), namespace)
+
+
+LazyAnime = _make_lazy(Anime)
+LazyManga = _make_lazy(Manga)
+LazyPerson = _make_lazy(Person)
+LazyCharacter = _make_lazy(Character)
+
+_LAZY_CLASSES = {Anime: LazyAnime, Manga: LazyManga, Person: LazyPerson, Character: LazyCharacter}
+
+
+def lazy_class(cls):
+    """Get the lazy subclass of a model class."""
+    return _LAZY_CLASSES[cls]
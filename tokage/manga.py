@@ -2,7 +2,8 @@
 
 import tokage
 from tokage.partial import PartialPerson
-from tokage.utils import create_relation, parse_id
+from tokage.base import cached_property, date_range, either, field, first
+from tokage.utils import create_relations, parse_id
 
 
 class Manga(tokage.TokageBase):
@@ -81,53 +82,42 @@ class Manga(tokage.TokageBase):
 
     """
 
+    _type = 'manga'
+
+    __slots__ = (
+        'id', 'title', 'type', 'synonyms', 'image', 'japanese_title', 'status', 'volumes',
+        'chapters', 'publishing', 'synopsis', '_publish_time', 'publish_start', 'publish_end',
+        '_raw_author', '_raw_genres', 'serialization', 'link', 'score', 'rank', 'popularity',
+        'members', 'favorites', '_raw_related',
+    )
+
+    _fields = {
+        'title': field('title'), 'type': field('type'), 'synonyms': field('title_synonyms'),
+        'image': field('image_url'), 'japanese_title': field('title_japanese'), 'status': field('status'),
+        'volumes': field('volumes'), 'chapters': field('chapters'), 'publishing': field('publishing'),
+        'synopsis': field('synopsis'), '_publish_time': field('published_string'),
+        'publish_start': date_range('published_string', 0), 'publish_end': date_range('published_string', 1),
+        '_raw_author': first('author'), '_raw_genres': either('genre', 'genres'),
+        # TODO: add serializations
+        'serialization': first('serialization'), 'link': field('link_canonical'), 'score': field('score'),
+        'rank': field('rank'), 'popularity': field('popularity'), 'members': field('members'),
+        'favorites': field('favorites'), '_raw_related': field('related'),
+    }
+
     def __init__(self, manga_id, data, **kwargs):
-        self.id = manga_id
-        self.title = data.get('title')
-        self.type = data.get('type')
-        self.synonyms = data.get('title_synonyms')
-        self.image = data.get('image_url')
-        self.japanese_title = data.get('title_japanese')
-        self.status = data.get('status')
-        self.volumes = data.get('volumes')
-        self.chapters = data.get('chapters')
-        self.publishing = data.get('publishing')
-        self.synopsis = data.get('synopsis')
-
-        self._publish_time = data.get('published_string')
-        if " to " not in self._publish_time:
-            self.publish_start = self._publish_time
-            self.publish_end = None
-        else:
-            self.publish_start, self.publish_end = self._publish_time.split(" to ")
-
-        self._raw_author = data.get('author')[0]
-        self._raw_genres = data.get('genre') or data.get('genres')
-        self.serialization = data.get('serialization')[0]  # TODO: add serializations
-        self.link = data.get('link_canonical')
-        self.score = data.get('score')
-        self.rank = data.get('rank')
-        self.popularity = data.get('popularity')
-        self.members = data.get('members')
-        self.favorites = data.get('favorites')
-        self._raw_related = data.get('related')
+        self.id = int(manga_id)
+        self._hydrate(data)
         super().__init__(state=kwargs.get("state"))
 
-    @property
+    @cached_property
     def author(self):
-        self._raw_author['mal_id'] = parse_id(self._raw_author['url'])
-        return PartialPerson.from_author(self._raw_author, state=self._state)
+        author = self._raw_author
+        return PartialPerson.interned(author['name'], parse_id(author['url']), author['url'], state=self._state)
 
-    @property
+    @cached_property
     def genres(self):
         return [g['name'] for g in self._raw_genres] if self._raw_genres else None
 
-    @property
+    @cached_property
     def related(self):
-        lst = []
-        for relation_type, relations in self._raw_related.items():
-            for relation in relations:
-                relation['relation'] = relation_type
-                obj = create_relation(relation, self._state)
-                lst.append(obj)
-        return lst
+        return create_relations(self._raw_related, self._state)
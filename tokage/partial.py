@@ -1,17 +1,59 @@
 """Partial Classes"""
 
 import tokage
+from tokage.base import TokageBase
 
 
-class BasePartial:
-    def __init__(self, *args, **kwargs):
-        self.__id = kwargs.get("id")
-        self.__type = self.__class__.__name__.split("Partial")[1].lower()
-        self.__state = kwargs.get("state")
+class BasePartial(TokageBase):
+    __slots__ = ('id', '_full')
+    # the attributes depending on the response the partial was seen in
+    _context = ()
+    _partial = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._type = cls.__name__.split("Partial")[1].lower()
+
+    def __init__(self, id, **kwargs):
+        self.id = int(id)
+        self._full = None
+        super().__init__(state=kwargs.get("state"))
+
+    def __getattr__(self, name):
+        # only called for missing attributes: fall back to the full object once upgraded
+        if name == '_full':
+            return None
+        if self._full is not None:
+            return getattr(self._full, name)
+        raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
+
+    @classmethod
+    def interned(cls, *args, **kwargs):
+        """Create a partial, returning the canonical one instead if the Client keeps an :class:`IdentityMap`.
+
+        The partial is also added to the Client's :class:`SearchIndex`, if it keeps one.
+        """
+        obj = cls(*args, **kwargs)
+        index = getattr(obj._state, 'search_index', None)
+        if index is not None and (obj._type, obj.id) not in index:
+            index.add(obj._type, obj.id, obj.title if cls._type in ('anime', 'manga') else obj.name, obj.url)
+        identity_map = getattr(obj._state, 'identity_map', None)
+        return obj if identity_map is None else identity_map.intern(obj)
+
+    @property
+    def full(self):
+        """The full object this partial was upgraded to by :meth:`request_full`, or None."""
+        full = self._full
+        # partials with response-specific attributes are linked to their canonical partial
+        return full.full if isinstance(full, BasePartial) else full
 
     async def request_full(self):
-        """Request an instance of the full, non-partial class. For example, :class:`PartialAnime` -> :class:`Anime`"""
-        return await getattr(self.__state, "get_" + self.__type)(self.__id)
+        """Request an instance of the full, non-partial class. For example, :class:`PartialAnime` -> :class:`Anime`
+
+        The partial is upgraded in place: afterwards, attributes it lacks are read from the full object.
+        """
+        self._full = await getattr(self._state, "get_" + self._type)(self.id)
+        return self._full
 
 
 class PartialAnime(BasePartial):
@@ -33,12 +75,14 @@ class PartialAnime(BasePartial):
         relation of the anime to a :class:`Person` or an :class:`Anime`.
 
     """
+    __slots__ = ('title', 'url', 'relation')
+    _context = ('relation',)
+
     def __init__(self, title, id, url, **kwargs):
         self.title = title
-        self.id = int(id)
         self.url = url
         self.relation = kwargs.get("relation")
-        super().__init__(id=id, state=kwargs.get("state"))
+        super().__init__(id, state=kwargs.get("state"))
 
     @classmethod
     def from_related(cls, data, **kwargs):
@@ -46,14 +90,14 @@ class PartialAnime(BasePartial):
         id = int(data.get('mal_id'))
         url = data.get('url')
         relation = data.get('relation')
-        return cls(title, id, url, relation=relation, state=kwargs.get("state"))
+        return cls.interned(title, id, url, relation=relation, state=kwargs.get("state"))
 
     @classmethod
     def from_character(cls, data, **kwargs):
         title = data.get('name')
         id = int(data.get('mal_id'))
         url = data.get('url')
-        return cls(title, id, url, state=kwargs.get("state"))
+        return cls.interned(title, id, url, state=kwargs.get("state"))
 
 
 class PartialManga(BasePartial):
@@ -75,12 +119,14 @@ class PartialManga(BasePartial):
         relation of the manga to a :class:`Person` or a :class:`Manga`.
 
     """
+    __slots__ = ('title', 'url', 'relation')
+    _context = ('relation',)
+
     def __init__(self, title, id, url, **kwargs):
         self.title = title
-        self.id = int(id)
         self.url = url
         self.relation = kwargs.get("relation")
-        super().__init__(id=id, state=kwargs.get("state"))
+        super().__init__(id, state=kwargs.get("state"))
 
     @classmethod
     def from_related(cls, data, **kwargs):
@@ -88,14 +134,14 @@ class PartialManga(BasePartial):
         id = int(data.get('mal_id'))
         url = data.get('url')
         relation = data.get('relation')
-        return cls(title, id, url, relation=relation, state=kwargs.get("state"))
+        return cls.interned(title, id, url, relation=relation, state=kwargs.get("state"))
 
     @classmethod
     def from_character(cls, data, **kwargs):
         title = data.get('name')
         id = int(data.get('mal_id'))
         url = data.get('url')
-        return cls(title, id, url, state=kwargs.get("state"))
+        return cls.interned(title, id, url, state=kwargs.get("state"))
 
 
 class PartialPerson(BasePartial):
@@ -117,12 +163,18 @@ class PartialPerson(BasePartial):
         If this is a partial voice actor, the language of the voice acting.
 
     """
+    __slots__ = ('name', 'url', 'language')
+    _context = ('language',)
+
     def __init__(self, name, id, url, **kwargs):
         self.name = name
-        self.id = int(id)
         self.url = url
         self.language = kwargs.get("language")
-        super().__init__(id=id, state=kwargs.get("state"))
+        super().__init__(id, state=kwargs.get("state"))
+
+    def iter_voice_acting(self):
+        """Stream this Person's voice acting roles. See :meth:`Client.iter_voice_acting`."""
+        return self._state.iter_voice_acting(self.id)
 
     @classmethod
     def from_voice_acting(cls, data, **kwargs):
@@ -130,14 +182,14 @@ class PartialPerson(BasePartial):
         id = int(data.get('mal_id'))
         url = data.get('url')
         lang = data.get('language')
-        return cls(name, id, url, language=lang, state=kwargs.get("state"))
+        return cls.interned(name, id, url, language=lang, state=kwargs.get("state"))
 
     @classmethod
     def from_author(cls, data, **kwargs):
         name = data.get('name')
         id = int(data.get('mal_id'))
         url = data.get('url')
-        return cls(name, id, url, state=kwargs.get("state"))
+        return cls.interned(name, id, url, state=kwargs.get("state"))
 
 
 class PartialCharacter(BasePartial):
@@ -159,23 +211,25 @@ class PartialCharacter(BasePartial):
         The anime this character is from.
 
     """
+    __slots__ = ('name', 'url', 'anime')
+    _context = ('anime',)
+
     def __init__(self, name, id, url, **kwargs):
         self.name = name
-        self.id = int(id)
         self.url = url
         self.anime = kwargs.get("anime")
-        super().__init__(id=id, state=kwargs.get("state"))
+        super().__init__(id, state=kwargs.get("state"))
 
     @classmethod
     def from_person(cls, data, anime, **kwargs):
         name = data.get('name')
         id = int(data.get('mal_id'))
         url = data.get('url')
-        return cls(name, id, url, anime=anime, state=kwargs.get("state"))
+        return cls.interned(name, id, url, anime=anime, state=kwargs.get("state"))
 
     @classmethod
     def from_search(cls, data, **kwargs):
         name = data['name']
         url = data['url']
         id = tokage.utils.parse_id(url)
-        return cls(name, id, url, state=kwargs.get("state"))
+        return cls.interned(name, id, url, state=kwargs.get("state"))
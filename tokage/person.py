@@ -1,8 +1,9 @@
 """Person object"""
 
 import tokage
+from tokage.base import cached_property, field
 from tokage.partial import PartialAnime, PartialCharacter, PartialManga
-from tokage.utils import parse_id
+from tokage.utils import parse_id, parse_ids
 
 
 class Person(tokage.TokageBase):
@@ -42,53 +43,74 @@ class Person(tokage.TokageBase):
 
     """
 
+    _type = 'person'
+
+    __slots__ = (
+        'id', 'link', 'name', 'image', 'favorites', 'birthday', 'more', 'website', '_raw_anime',
+        '_raw_manga', '_raw_voice_acting',
+    )
+
+    _fields = {
+        'link': field('link_canonical'), 'name': field('name'), 'image': field('image_url'),
+        'favorites': field('member_favorites'), 'birthday': field('birthday'), 'more': field('more'),
+        'website': field('website'), '_raw_anime': field('anime_staff_position'),
+        '_raw_manga': field('published_manga'), '_raw_voice_acting': field('voice_acting_role'),
+    }
+
     def __init__(self, person_id, data, **kwargs):
-        self.id = person_id
-        self.link = data.get('link_canonical')
-        self.name = data.get('name')
-        self.image = data.get('image_url')
-        self.favorites = data.get('member_favorites')
-        self.birthday = data.get('birthday')
-        self.more = data.get('more')
-        self.website = data.get('website')
-        self._raw_anime = data.get('anime_staff_position')
-        self._raw_manga = data.get('published_manga')
-        self._raw_voice_acting = data.get('voice_acting_role')
+        self.id = int(person_id)
+        self._hydrate(data)
         super().__init__(state=kwargs.get("state"))
 
-    @property
+    @cached_property
     def voice_acting(self):
-        lst = []
-        for va in self._raw_voice_acting:
-            char = va['character']
-            char['mal_id'] = parse_id(char['url'])
-            anime = va['anime']
-            anime['mal_id'] = parse_id(anime['url'])
-            anime_obj = PartialAnime.from_character(anime, state=self._state)
-            obj = PartialCharacter.from_person(char, anime_obj, state=self._state)
-            lst.append(obj)
-        return lst
-
-    @property
+        roles = self._raw_voice_acting
+        char_ids = parse_ids([va['character']['url'] for va in roles])
+        anime_ids = parse_ids([va['anime']['url'] for va in roles])
+        return [voice_acting_role(va, self._state, char_id, anime_id)
+                for va, char_id, anime_id in zip(roles, char_ids, anime_ids)]
+
+    @cached_property
     def anime(self):
-        lst = []
-        for position in self._raw_anime:
-            anime = position['anime']
-            anime['mal_id'] = parse_id(anime['url'])
-            anime['relation'] = position['role']
-            anime['title'] = anime.pop('name')
-            obj = PartialAnime.from_related(anime, state=self._state)
-            lst.append(obj)
-        return lst
-
-    @property
+        positions = self._raw_anime
+        ids = parse_ids([position['anime']['url'] for position in positions])
+        return [anime_position(position, self._state, id) for position, id in zip(positions, ids)]
+
+    @cached_property
     def manga(self):
-        lst = []
-        for position in self._raw_manga:
-            manga = position['manga']
-            manga['mal_id'] = parse_id(manga['url'])
-            manga['relation'] = position['role']
-            manga['title'] = manga.pop('name')
-            obj = PartialManga.from_related(manga, state=self._state)
-            lst.append(obj)
-        return lst
+        positions = self._raw_manga
+        ids = parse_ids([position['manga']['url'] for position in positions])
+        return [manga_position(position, self._state, id) for position, id in zip(positions, ids)]
+
+
+def voice_acting_role(va, state, char_id=None, anime_id=None):
+    """Build a :class:`PartialCharacter` from a `voice_acting_role` entry.
+
+    IDs are parsed from the entry's links unless given.
+    """
+    char = va['character']
+    anime = va['anime']
+    anime_id = anime_id or parse_id(anime['url'])
+    char_id = char_id or parse_id(char['url'])
+    anime_obj = PartialAnime.interned(anime['name'], anime_id, anime['url'], state=state)
+    return PartialCharacter.interned(char['name'], char_id, char['url'], anime=anime_obj, state=state)
+
+
+def anime_position(position, state, id=None):
+    """Build a :class:`PartialAnime` from an `anime_staff_position` entry.
+
+    The ID is parsed from the entry's link unless given.
+    """
+    anime = position['anime']
+    return PartialAnime.interned(anime['name'], id or parse_id(anime['url']), anime['url'],
+                                 relation=position['role'], state=state)
+
+
+def manga_position(position, state, id=None):
+    """Build a :class:`PartialManga` from a `published_manga` entry.
+
+    The ID is parsed from the entry's link unless given.
+    """
+    manga = position['manga']
+    return PartialManga.interned(manga['name'], id or parse_id(manga['url']), manga['url'],
+                                 relation=position['role'], state=state)
@@ -0,0 +1,170 @@
+"""Connection pool settings and statistics for the Client's session"""
+
+import time
+
+__all__ = ('PoolOptions', 'PoolStats')
+
+
+class PoolOptions:
+    """Connection pool settings for the session a :class:`Client` creates.
+
+    The same options are accepted under both async libraries. Under `multio`, `asks`
+    keeps a single pool per session, so `limit` (capped by `limit_per_host`, since every
+    request goes to the Jikan host) sizes it; `asks` has no keep-alive timeout or DNS
+    cache, so those options are ignored there.
+
+    Parameters
+    ----------
+    limit : Optional[int]
+        Maximum amount of open connections. Defaults to 100. `None` means unbounded.
+
+    limit_per_host : Optional[int]
+        Maximum amount of open connections to a single host. Defaults to unbounded.
+
+    keepalive_timeout : Optional[float]
+        Seconds an idle connection is kept open for reuse. Defaults to 15.
+        `None` closes connections after every response.
+
+    dns_cache_ttl : Optional[float]
+        Seconds resolved host names are cached for. Defaults to 10. `None` caches them forever.
+
+    use_dns_cache : Optional[bool]
+        Whether to cache resolved host names at all. Defaults to `True`.
+
+    compress : Optional[bool]
+        Whether to ask for compressed responses and decompress them. Defaults to `True`.
+
+    """
+    def __init__(self, *, limit=100, limit_per_host=None, keepalive_timeout=15, dns_cache_ttl=10,
+                 use_dns_cache=True, compress=True):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.use_dns_cache = use_dns_cache
+        self.compress = compress
+
+    def connections(self):
+        """Get the effective maximum amount of connections to the Jikan host, or None if unbounded."""
+        limits = [limit for limit in (self.limit, self.limit_per_host) if limit]
+        return min(limits) if limits else None
+
+    def aiohttp_kwargs(self, loop=None):
+        """Get the `aiohttp.ClientSession` keyword arguments for these settings, including its connector."""
+        import aiohttp
+        if self.keepalive_timeout is None:
+            keepalive = {'force_close': True}
+        else:
+            keepalive = {'keepalive_timeout': self.keepalive_timeout}
+        connector = aiohttp.TCPConnector(limit=self.limit or 0, limit_per_host=self.limit_per_host or 0,
+                                         use_dns_cache=self.use_dns_cache, ttl_dns_cache=self.dns_cache_ttl,
+                                         loop=loop, **keepalive)
+        kwargs = {'connector': connector}
+        if not self.compress:
+            kwargs['auto_decompress'] = False
+            kwargs['headers'] = {'Accept-Encoding': 'identity'}
+        return kwargs
+
+    def asks_kwargs(self):
+        """Get the `asks.Session` keyword arguments for these settings."""
+        kwargs = {}
+        connections = self.connections()
+        if connections is not None:
+            kwargs['connections'] = connections
+        if not self.compress:
+            kwargs['headers'] = {'Accept-Encoding': 'identity'}
+        return kwargs
+
+
+class PoolStats:
+    """A snapshot of a :class:`Client`'s connection pool, see :meth:`Client.pool_stats`.
+
+    Attributes
+    ----------
+    limit : Optional[int]
+        Maximum amount of connections to the Jikan host, or None if unbounded.
+
+    in_use : int
+        Connections currently serving a request.
+
+    idle : int
+        Open connections kept alive for reuse.
+
+    waiting : int
+        Requests currently waiting for a free connection.
+
+    waits : int
+        Amount of requests which had to wait for a free connection.
+
+    total_wait : float
+        Total time requests spent waiting for a free connection, in seconds.
+
+    max_wait : float
+        Longest time a single request waited for a free connection, in seconds.
+
+    """
+    __slots__ = ('limit', 'in_use', 'idle', 'waiting', 'waits', 'total_wait', 'max_wait')
+
+    def __init__(self, limit, in_use, idle, waiting, waits, total_wait, max_wait):
+        self.limit = limit
+        self.in_use = in_use
+        self.idle = idle
+        self.waiting = waiting
+        self.waits = waits
+        self.total_wait = total_wait
+        self.max_wait = max_wait
+
+    def __repr__(self):
+        return '<PoolStats limit={0.limit} in_use={0.in_use} idle={0.idle} waiting={0.waiting} ' \
+               'waits={0.waits} total_wait={0.total_wait:.3f}>'.format(self)
+
+    @property
+    def average_wait(self):
+        return self.total_wait / self.waits if self.waits else 0.0
+
+
+class _WaitTracker:
+    """Times the waits for a free connection of an `aiohttp` session through its trace hooks."""
+    def __init__(self):
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def trace_config(self):
+        import aiohttp
+        config = aiohttp.TraceConfig()
+        config.on_connection_queued_start.append(self._queued_start)
+        config.on_connection_queued_end.append(self._queued_end)
+        return config
+
+    async def _queued_start(self, session, context, params):
+        context.queued = time.monotonic()
+
+    async def _queued_end(self, session, context, params):
+        waited = time.monotonic() - context.queued
+        self.waits += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+
+def _pool_counts(lib, session):
+    """Get the connection limit and the amount of in use connections, idle connections and waiting
+    requests of a session's pool, from the internals of `aiohttp` or `asks`."""
+    if lib == 'asyncio':
+        connector = session.connector
+        if connector is None:
+            return None, 0, 0, 0
+        limits = [limit for limit in (connector.limit, connector.limit_per_host) if limit]
+        in_use = len(getattr(connector, '_acquired', ()))
+        idle = sum(len(conns) for conns in getattr(connector, '_conns', {}).values())
+        waiting = sum(len(waiters) for waiters in getattr(connector, '_waiters', {}).values())
+        return (min(limits) if limits else None), in_use, idle, waiting
+
+    limit = getattr(session, '_connections', None)
+    in_use = len(getattr(session, '_checked_out_sockets', ()))
+    idle = len(getattr(session, '_conn_pool', ()))
+    waiting = 0
+    sema = getattr(session, '_sema', None)
+    if sema is not None and hasattr(sema, 'statistics'):
+        waiting = sema.statistics().tasks_waiting
+    return limit, in_use, idle, waiting
@@ -0,0 +1,211 @@
+"""Speculative prefetching of the entities linked to retrieved ones"""
+
+from collections import deque
+
+from tokage.crawler import TYPES
+from tokage.lazy import LazyPayload
+from tokage.ratelimit import PRIORITY_LOW
+from tokage.utils import parse_id
+
+__all__ = ('Prefetcher',)
+
+# amount of prefetched URLs remembered to count hits
+WARMED_SIZE = 1024
+
+
+def _links(type_, data):
+    """Get the `(type, id)` pairs a payload links to, following the links a :class:`Crawler` follows.
+
+    Reads the raw payload, so no partials are built.
+    """
+    if type_ in ('anime', 'manga'):
+        for relations in (data.get('related') or {}).values():
+            for relation in relations:
+                yield 'anime' if relation.get('type') == 'anime' else 'manga', relation.get('mal_id')
+        if type_ == 'manga':
+            for author in (data.get('author') or ())[:1]:
+                yield 'person', parse_id(author['url'])
+    elif type_ == 'person':
+        for key, kind in (('anime_staff_position', 'anime'), ('published_manga', 'manga')):
+            for position in data.get(key) or ():
+                yield kind, parse_id(position[kind]['url'])
+        for role in data.get('voice_acting_role') or ():
+            yield 'character', parse_id(role['character']['url'])
+            yield 'anime', parse_id(role['anime']['url'])
+    elif type_ == 'character':
+        for key, kind in (('animeography', 'anime'), ('mangaography', 'manga'),
+                          ('voice_actors', 'person'), ('voice_actor', 'person')):
+            for item in data.get(key) or ():
+                yield kind, parse_id(item['url'])
+
+
+class Prefetcher:
+    """Warms the cache of a :class:`Client` with the entities linked to the ones it retrieves.
+
+    After a `get_*` method (or :meth:`BasePartial.request_full`) retrieves an entity from
+    the API, the first `limit` entities it links to (the same links a :class:`Crawler`
+    follows, such as the `related` entries of an :class:`Anime`) are requested in the
+    background, so that following them is answered from the cache. Entities answered from
+    the cache, and prefetched ones, are not followed. Links are read from the response
+    payload, so lazy models (see :class:`Client`'s `lazy` option) stay unloaded.
+
+    Prefetches wait in the `PRIORITY_LOW` lane of the :class:`RateLimiter`, so foreground
+    requests always go first, and are skipped while foreground requests are queued.
+    Entities already cached or being requested are not prefetched again, and checking
+    the cache does not change its statistics or eviction order.
+
+    Only supported with the `asyncio` library, and requires the Client to have a cache.
+
+    Parameters
+    ----------
+    limit : Optional[int]
+        Maximum amount of linked entities prefetched per retrieved entity. Defaults to 5.
+
+    budget : Optional[int]
+        Maximum amount of prefetch requests over the Prefetcher's lifetime. It can be
+        raised later through the attribute. Defaults to 200; `None` is unbounded.
+
+    concurrency : Optional[int]
+        Maximum amount of prefetch requests at once. Defaults to 2.
+
+    types : Optional[Iterable[str]]
+        The types of entities prefetched. Defaults to every type.
+
+    max_queue : Optional[int]
+        Maximum amount of queued prefetches. The oldest are skipped beyond it, as the most
+        recently retrieved entities are the most likely to be followed. Defaults to 100.
+
+    priority : Optional[int]
+        The :class:`RateLimiter` lane of prefetch requests. Defaults to `PRIORITY_LOW`.
+
+    Attributes
+    ----------
+    budget : Optional[int]
+        Maximum amount of prefetch requests.
+
+    prefetched : int
+        Amount of prefetch requests made so far.
+
+    hits : int
+        Amount of prefetched entities which were later requested by the Client.
+
+    failed : int
+        Amount of prefetch requests which failed.
+
+    skipped : int
+        Amount of queued prefetches skipped because the queue was full, the budget spent
+        or foreground requests were waiting.
+
+    """
+    def __init__(self, *, limit=5, budget=200, concurrency=2, types=TYPES, max_queue=100,
+                 priority=PRIORITY_LOW):
+        types = frozenset(types)
+        unknown = types.difference(TYPES)
+        if unknown:
+            raise ValueError("Unknown entity types: {}".format(', '.join(sorted(unknown))))
+        self.limit = limit
+        self.budget = budget
+        self.concurrency = concurrency
+        self.types = types
+        self.priority = priority
+        self.prefetched = 0
+        self.hits = 0
+        self.failed = 0
+        self.skipped = 0
+        self._client = None
+        self._queue = deque(maxlen=max_queue)
+        self._tasks = set()
+        self._warmed = {}
+        # amount of prefetch requests in progress, which may be waiting in the rate limiter
+        self._active = 0
+
+    def __repr__(self):
+        return '<Prefetcher prefetched={0.prefetched} hits={0.hits} hit_rate={0.hit_rate:.1%}>'.format(self)
+
+    def _bind(self, client):
+        self._client = client
+
+    @property
+    def hit_rate(self):
+        """Fraction of prefetch requests whose entity was later requested."""
+        return self.hits / self.prefetched if self.prefetched else 0.0
+
+    @property
+    def remaining(self):
+        """Amount of prefetch requests left in the budget, or None if unbounded."""
+        return None if self.budget is None else max(0, self.budget - self.prefetched)
+
+    def _exhausted(self):
+        return self.budget is not None and self.prefetched >= self.budget
+
+    def _schedule(self, url, type_, data):
+        """Queue the entities linked to by the payload of a response from the API."""
+        # responses to prefetches which were not requested since are not followed
+        if type_ not in TYPES or url in self._warmed or self._exhausted():
+            return
+        if isinstance(data, LazyPayload):
+            # read the links without keeping the decoded payload in the lazy payload
+            data = data._decoded(keep=False)
+        client = self._client
+        urls = []
+        for type_, id in _links(type_, data):
+            if type_ not in self.types or id is None:
+                continue
+            url = client.base_url + type_ + '/' + str(id)
+            if url in urls:
+                continue
+            urls.append(url)
+            if len(urls) >= self.limit:
+                break
+
+        queue = self._queue
+        # queued in reverse, as the queue is consumed from its end
+        for url in reversed(urls):
+            if len(queue) == queue.maxlen:
+                self.skipped += 1
+            queue.append(url)
+        while queue and len(self._tasks) < self.concurrency:
+            task = client._async.spawn(self._work())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _work(self):
+        client = self._client
+        queue = self._queue
+        while queue:
+            url = queue.pop()
+            rate_limit = client.rate_limit
+            if self._exhausted() or (rate_limit is not None and rate_limit.queue_depth > self._active):
+                self.skipped += 1
+                continue
+            if await client.cache.is_fresh(url) or url in client._inflight:
+                continue
+
+            self._warm(url)
+            self.prefetched += 1
+            self._active += 1
+            try:
+                await client._coalesce(url, self.priority)
+            except Exception:
+                self.failed += 1
+                self._warmed.pop(url, None)
+            finally:
+                self._active -= 1
+
+    def _warm(self, url):
+        warmed = self._warmed
+        warmed[url] = None
+        if len(warmed) > WARMED_SIZE:
+            del warmed[next(iter(warmed))]
+
+    def _hit(self, url):
+        """Count a request of the Client for a URL, if it was prefetched."""
+        if url in self._warmed:
+            del self._warmed[url]
+            self.hits += 1
+
+    def cancel(self):
+        """Cancel the running prefetches and clear the queue."""
+        self._queue.clear()
+        for task in list(self._tasks):
+            task.cancel()
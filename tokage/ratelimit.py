@@ -0,0 +1,144 @@
+"""Request pacing for the Client"""
+
+import heapq
+import itertools
+import time
+
+__all__ = ('PRIORITY_HIGH', 'PRIORITY_NORMAL', 'PRIORITY_LOW', 'RateLimiter')
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+class _Bucket:
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, amount, period):
+        self.rate = amount / period
+        self.capacity = amount
+        self.tokens = amount
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self):
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+
+class _Waiter:
+    __slots__ = ('priority', 'seq', 'event')
+
+    def __init__(self, priority, seq):
+        self.priority = priority
+        self.seq = seq
+        self.event = None
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class RateLimiter:
+    """A token bucket scheduler pacing the requests made by a :class:`Client`.
+
+    Requests wait in priority lanes: a waiting request with a lower priority value is
+    always let through before one with a higher value, and requests of the same
+    priority are let through in order of arrival.
+
+    Parameters
+    ----------
+    per_second : Optional[int]
+        Maximum amount of requests per second. Defaults to 2. `None` disables this limit.
+
+    per_minute : Optional[int]
+        Maximum amount of requests per minute. Defaults to 30. `None` disables this limit.
+
+    Attributes
+    ----------
+    acquired : int
+        Amount of requests let through so far.
+
+    total_wait : float
+        Total time requests spent waiting, in seconds.
+
+    max_wait : float
+        Longest time a single request waited, in seconds.
+
+    """
+    def __init__(self, per_second=2, per_minute=30):
+        self._buckets = []
+        if per_second is not None:
+            self._buckets.append(_Bucket(per_second, 1))
+        if per_minute is not None:
+            self._buckets.append(_Bucket(per_minute, 60))
+        self._queue = []
+        self._counter = itertools.count()
+        self._async = None
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _bind(self, asynclib):
+        self._async = asynclib
+
+    @property
+    def queue_depth(self):
+        """Amount of requests currently waiting."""
+        return len(self._queue)
+
+    @property
+    def average_wait(self):
+        """Average time a request waited, in seconds."""
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+    def _delay(self):
+        now = time.monotonic()
+        delay = 0.0
+        for bucket in self._buckets:
+            bucket.refill(now)
+            delay = max(delay, bucket.delay())
+        return delay
+
+    def _wake(self):
+        if self._queue:
+            event = self._queue[0].event
+            if event is not None:
+                event.set()
+
+    def _remove(self, waiter):
+        was_head = self._queue[0] is waiter
+        self._queue.remove(waiter)
+        heapq.heapify(self._queue)
+        if was_head:
+            self._wake()
+
+    async def acquire(self, priority=PRIORITY_NORMAL):
+        """Wait until a request of the given priority may be sent."""
+        start = time.monotonic()
+        waiter = _Waiter(priority, next(self._counter))
+        heapq.heappush(self._queue, waiter)
+        try:
+            while True:
+                if self._queue[0] is waiter:
+                    delay = self._delay()
+                    if delay <= 0:
+                        break
+                    await self._async.sleep(delay)
+                else:
+                    waiter.event = self._async.event()
+                    await waiter.event.wait()
+        except BaseException:
+            self._remove(waiter)
+            raise
+
+        heapq.heappop(self._queue)
+        for bucket in self._buckets:
+            bucket.tokens -= 1
+        self._wake()
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
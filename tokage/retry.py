@@ -0,0 +1,129 @@
+"""Retrying and failing fast on upstream errors"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+from tokage.errors import CircuitOpen
+
+__all__ = ('RetryPolicy', 'CircuitBreaker')
+
+
+def parse_retry_after(value):
+    """Parse a `Retry-After` header into seconds, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Decides which failed requests the :class:`Client` retries, and how long it waits in between.
+
+    Waits grow exponentially from `backoff`, capped by `max_backoff`. With `jitter`, a random
+    wait between zero and that value is used instead, so clients do not retry in lockstep.
+    A `Retry-After` header sent by the API takes precedence (still capped by `max_backoff`).
+
+    Parameters
+    ----------
+    attempts : Optional[int]
+        Maximum amount of attempts per request, including the first one. Defaults to 3.
+
+    backoff : Optional[float]
+        Wait before the first retry, in seconds. Defaults to 0.5.
+
+    max_backoff : Optional[float]
+        Maximum wait between attempts, in seconds. Defaults to 30.
+
+    jitter : Optional[bool]
+        Whether to randomize waits. Defaults to `True`.
+
+    statuses : Optional[Iterable[int]]
+        HTTP statuses which are retried. Defaults to 429 and the 5xx statuses of temporary failures.
+
+    Attributes
+    ----------
+    retries : int
+        Amount of retries made so far.
+
+    """
+    def __init__(self, *, attempts=3, backoff=0.5, max_backoff=30.0, jitter=True,
+                 statuses=(429, 500, 502, 503, 504)):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.retries = 0
+
+    def delay(self, attempt, retry_after=None):
+        """Get the wait before retrying after the given failed attempt (starting at 0)."""
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class CircuitBreaker:
+    """Fails requests fast while the API is unhealthy.
+
+    After `threshold` consecutive failures the circuit opens, and requests raise
+    :class:`CircuitOpen` without being sent. Once `reset_timeout` has passed, a single
+    trial request is let through: the circuit closes if it succeeds, and opens again if not.
+
+    Parameters
+    ----------
+    threshold : Optional[int]
+        Consecutive failures opening the circuit. Defaults to 5.
+
+    reset_timeout : Optional[float]
+        Seconds the circuit stays open before a trial request. Defaults to 30.
+
+    Attributes
+    ----------
+    state : str
+        Either `closed`, `open` or `half-open`.
+
+    failures : int
+        Current amount of consecutive failures.
+
+    trips : int
+        Amount of times the circuit opened.
+
+    """
+    def __init__(self, *, threshold=5, reset_timeout=30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+
+    def before_request(self):
+        """Raise :class:`CircuitOpen` if a request may not be sent right now."""
+        if self.state == 'closed':
+            return
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            raise CircuitOpen("The API is failing, requests are suspended")
+        # let a trial request through; another one is allowed if it never reports back
+        self.state = 'half-open'
+        self._opened_at = now
+
+    def record_success(self):
+        self.state = 'closed'
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == 'half-open' or self.failures >= self.threshold:
+            if self.state != 'open':
+                self.trips += 1
+            self.state = 'open'
+            self._opened_at = time.monotonic()
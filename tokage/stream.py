@@ -0,0 +1,91 @@
+"""Incremental decoding of large JSON responses"""
+
+import codecs
+import json
+import re
+
+from tokage.utils import may_have_entities, unescape_in_place
+
+_WHITESPACE = ' \t\n\r'
+_DECODER = json.JSONDecoder()
+
+
+class ArrayNotFound(ValueError):
+    """Raised by :func:`iter_json_array` when the response has no such array."""
+
+
+async def iter_json_array(chunks, key, encoding='utf-8'):
+    """Decode the items of the JSON array stored under `key` while its bytes arrive.
+
+    `chunks` is an async iterable of bytes. Items are unescaped like :func:`tokage.utils.decode_json`
+    and yielded as soon as they are complete, so the whole body is never held in memory.
+
+    Raises :class:`ArrayNotFound` if the response has no such array, and a `ValueError`
+    if the array is malformed or incomplete.
+    """
+    pattern = re.compile(r'"{}"\s*:\s*\['.format(re.escape(key)))
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ''
+    pos = None
+    eof = False
+    after_item = after_comma = False
+    chunks = chunks.__aiter__()
+
+    while True:
+        if pos is None:
+            match = pattern.search(buffer)
+            if match is not None:
+                pos = match.end()
+            elif not eof:
+                # keep enough to match a key split across chunks
+                buffer = buffer[-(len(key) + 64):]
+        if pos is not None:
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+                if pos == len(buffer):
+                    break
+                char = buffer[pos]
+                if after_item:
+                    # exactly one comma between items
+                    if char == ']':
+                        return
+                    if char != ',':
+                        raise ValueError("Expected `,` or `]` after an item of the `{}` array".format(key))
+                    after_item = False
+                    after_comma = True
+                    pos += 1
+                    continue
+                if char == ']' and not after_comma:
+                    return
+                if char in ',]':
+                    raise ValueError("Unexpected `{}` in the `{}` array".format(char, key))
+                try:
+                    item, end = _DECODER.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    break
+                if end == len(buffer) and not eof:
+                    # a number may continue in the next chunk
+                    break
+                if may_have_entities(buffer[pos:end]):
+                    item = unescape_in_place(item)
+                pos = end
+                after_item = True
+                after_comma = False
+                yield item
+            buffer = buffer[pos:]
+            pos = 0
+
+        if eof:
+            if pos is None:
+                raise ArrayNotFound("The response has no `{}` array".format(key))
+            raise ValueError("The `{}` array is incomplete".format(key))
+        try:
+            chunk = await chunks.__anext__()
+        except StopAsyncIteration:
+            eof = True
+            buffer += text_decoder.decode(b'', final=True)
+        else:
+            buffer += text_decoder.decode(chunk)
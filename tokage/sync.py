@@ -0,0 +1,164 @@
+"""Synchronous facade of the Client"""
+
+import asyncio
+import concurrent.futures
+import threading
+
+from tokage.client import Client
+
+__all__ = ('SyncClient',)
+
+# the Client coroutines mirrored as blocking methods
+METHODS = (
+    'request', 'get_anime', 'get_manga', 'get_character', 'get_person',
+    'get_anime_many', 'get_manga_many', 'get_character_many', 'get_person_many',
+    'search_anime', 'search_manga', 'search_character', 'search_person', 'search_id',
+)
+# the Client async iterators mirrored as blocking iterators
+ITERATORS = (
+    'iter_anime_many', 'iter_manga_many', 'iter_character_many', 'iter_person_many',
+    'iter_voice_acting', 'iter_staff_positions', 'iter_published_manga',
+)
+
+
+class SyncClient:
+    """A thread-safe, blocking facade of :class:`Client`, for threaded applications.
+
+    A single event loop runs in a background thread, along with the :class:`Client`
+    and its `aiohttp` session: every thread calling the SyncClient shares its connection
+    pool, cache and rate limiter, and calls from many threads run concurrently on the loop.
+
+    The `get_*`, `search_*` and `request` methods of :class:`Client` are available as
+    blocking methods, and its `iter_*` methods as blocking iterators. Partials returned
+    by a SyncClient can be upgraded with :meth:`request_full`.
+
+    It can be used as a context manager, which calls :meth:`close` on exit.
+
+    Parameters
+    ----------
+    timeout : Optional[float]
+        Maximum time a call waits for its result, in seconds. The call is cancelled
+        and `concurrent.futures.TimeoutError` is raised when it is exceeded.
+        Defaults to waiting indefinitely.
+
+    \\*\\*kwargs
+        Keyword arguments of :class:`Client`, except `session`, `lib` and `loop`.
+
+    Attributes
+    ----------
+    client : :class:`Client`
+        The underlying Client. Its coroutines must only be run through :meth:`run`.
+
+    """
+    def __init__(self, *, timeout=None, **kwargs):
+        for name in ('session', 'lib', 'loop'):
+            if name in kwargs:
+                raise TypeError("SyncClient does not accept the `{}` argument".format(name))
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name='tokage-sync', daemon=True)
+        self._thread.start()
+        self._closed = False
+        try:
+            self.client = self.run(self._make_client(kwargs))
+        except BaseException:
+            self._closed = True
+            self._stop_loop()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _make_client(self, kwargs):
+        # the session has to be created in the loop's thread
+        return Client(loop=self._loop, **kwargs)
+
+    def run(self, coro, timeout=None):
+        """Run a coroutine on the SyncClient's loop and wait for its result.
+
+        `timeout` defaults to the SyncClient's `timeout`.
+        """
+        if self._closed:
+            coro.close()
+            raise RuntimeError("The SyncClient is closed")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(self.timeout if timeout is None else timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def _iterate(self, agen):
+        async def next_item():
+            return await agen.__anext__()
+
+        try:
+            while True:
+                try:
+                    yield self.run(next_item())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._closed:
+                self.run(agen.aclose())
+
+    def request_full(self, partial):
+        """Upgrade a partial to its full object, as :meth:`BasePartial.request_full` does, and return it."""
+        return self.run(partial.request_full())
+
+    def pool_stats(self):
+        """See :meth:`Client.pool_stats`."""
+        return self.client.pool_stats()
+
+    def close(self):
+        """Close the session and stop the background loop. Calling it again does nothing."""
+        if self._closed:
+            return
+        try:
+            self.run(self.client.cleanup())
+        finally:
+            self._closed = True
+            self._stop_loop()
+
+    def _stop_loop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def _mirror(name):
+    method = getattr(Client, name)
+
+    def call(self, *args, **kwargs):
+        return self.run(method(self.client, *args, **kwargs))
+
+    call.__name__ = name
+    call.__qualname__ = 'SyncClient.' + name
+    call.__doc__ = method.__doc__
+    return call
+
+
+def _mirror_iterator(name):
+    method = getattr(Client, name)
+
+    def iterate(self, *args, **kwargs):
+        return self._iterate(method(self.client, *args, **kwargs))
+
+    iterate.__name__ = name
+    iterate.__qualname__ = 'SyncClient.' + name
+    iterate.__doc__ = method.__doc__
+    return iterate
+
+
+for _name in METHODS:
+    setattr(SyncClient, _name, _mirror(_name))
+for _name in ITERATORS:
+    setattr(SyncClient, _name, _mirror_iterator(_name))
+del _name
@@ -1,22 +1,102 @@
 """Utilities for the library"""
 
+import json
 import re
+from array import array
+from html import unescape
+
 from tokage.partial import PartialAnime, PartialManga
 
 
-def create_relation(data, state):
-    if data.get('type') == "anime":
-        return PartialAnime.from_related(data, state=state)
-    else:
-        return PartialManga.from_related(data, state=state)
+def create_relation(data, relation, state):
+    cls = PartialAnime if data.get('type') == "anime" else PartialManga
+    return cls.interned(data.get('title'), data.get('mal_id'), data.get('url'), relation=relation, state=state)
+
+
+def create_relations(raw_related, state):
+    """Build the partials of a `related` payload, without modifying it."""
+    return [
+        create_relation(relation, relation_type, state)
+        for relation_type, relations in raw_related.items()
+        for relation in relations
+    ]
+
+
+_ID_PATTERN = re.compile(r'/(\d+)/')
 
 
 def parse_id(link):
-    """Get ID from a myanimelist link."""
-    pattern = r'(?:\/([\d]+)\/)'
-    match = re.search(pattern, link)
+    """Get ID from a myanimelist link, as a string."""
+    match = _ID_PATTERN.search(link)
     if match:
-        target_id = match.group(1)
-        return target_id
+        return match.group(1)
     else:
         return None
+
+
+def parse_ids(links):
+    """Get the IDs of many myanimelist links at once.
+
+    Returns an `array('l')` of IDs, in the order of `links`. Links without an ID give 0.
+    """
+    ids = array('l')
+    append = ids.append
+    search = _ID_PATTERN.search
+    for link in links:
+        # fast path for https://myanimelist.net/<type>/<id>/<name>
+        parts = link.split('/', 5)
+        if len(parts) == 6 and parts[4].isdecimal() and not parts[3].isdecimal():
+            append(int(parts[4]))
+            continue
+        match = search(link)
+        append(int(match.group(1)) if match else 0)
+    return ids
+
+
+def unescape_in_place(value):
+    """Unescape the HTML entities in the strings of a decoded JSON value, updating dicts and lists in place.
+
+    Returns the unescaped value, which is a new object only for strings.
+    """
+    if type(value) is str:
+        return unescape(value) if '&' in value else value
+    if type(value) is dict:
+        escaped_keys = False
+        for key, item in value.items():
+            if type(item) is str:
+                if '&' in item:
+                    value[key] = unescape(item)
+            elif type(item) is dict or type(item) is list:
+                unescape_in_place(item)
+            if '&' in key:
+                escaped_keys = True
+        if escaped_keys:
+            # rebuild the dict to keep the order of the keys
+            items = list(value.items())
+            value.clear()
+            value.update((unescape(key) if '&' in key else key, item) for key, item in items)
+    elif type(value) is list:
+        for i, item in enumerate(value):
+            if type(item) is str:
+                if '&' in item:
+                    value[i] = unescape(item)
+            elif type(item) is dict or type(item) is list:
+                unescape_in_place(item)
+    return value
+
+
+def may_have_entities(document):
+    """Whether a JSON document, as `str` or UTF-8 `bytes`, may hold HTML entities.
+
+    Its `&` characters are either raw or escaped as `\\u0026`, which has no hex letters to vary in case.
+    """
+    if type(document) is bytes:
+        return b'&' in document or b'\\u0026' in document
+    return '&' in document or '\\u0026' in document
+
+
+def decode_json(text):
+    """Decode a JSON document, unescaping the HTML entities in its strings."""
+    if not may_have_entities(text):
+        return json.loads(text)
+    return unescape_in_place(json.loads(text))